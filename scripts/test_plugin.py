@@ -46,6 +46,7 @@ for resolution in RESOLUTIONS:
     for orientation in ORIENTATIONS:
         mock_device_config.get_resolution.return_value = resolution
         mock_device_config.get_config.return_value = orientation
+        mock_device_config.get_effective_resolution.return_value = resolution[::-1] if orientation == "vertical" else resolution
 
         img = plugin_instance.generate_image(plugin_settings, mock_device_config)
 
@@ -1,46 +1,170 @@
 from flask import Blueprint, request, jsonify, current_app, render_template
-from dotenv import dotenv_values
+import codecs
 import os
 import re
+import stat
 import logging
+import tempfile
+import threading
 
 logger = logging.getLogger(__name__)
 apikeys_bp = Blueprint("apikeys", __name__)
 
-# Path to .env file
+# Parsed .env contents per path, validated against (mtime_ns, size)
+_ENV_CACHE = {}
+_ENV_LOCK = threading.Lock()
+
+# Valid environment variable names
+_KEY_RE = re.compile(r'^[A-Za-z_][A-Za-z0-9_]*\Z')
+
+# Values containing whitespace, quotes or `#` must be written double-quoted
+_NEEDS_QUOTE_RE = re.compile(r'[\s\'"#]')
+
+# Quoted values, matched from the opening quote to its closing quote; a
+# backslash always escapes the next character (same rules as python-dotenv)
+_DOUBLE_QUOTED_RE = re.compile(r'"((?:\\.|[^"\\])*)"')
+_SINGLE_QUOTED_RE = re.compile(r"'((?:\\.|[^'\\])*)'")
+
+# Backslash escapes decoded inside double- and single-quoted values
+_DOUBLE_ESCAPES_RE = re.compile(r'\\[\\\'"abfnrtv]')
+_SINGLE_ESCAPES_RE = re.compile(r"\\[\\']")
+
+# Inline comment after an unquoted value
+_INLINE_COMMENT_RE = re.compile(r'\s+#.*')
+
+# Optional `export` prefix before a key
+_EXPORT_RE = re.compile(r'^export\s+')
+
+# Longest mask shown for a value, sliced per entry
+_MASK = "●" * 20
+
+# Path to .env file in the project root
+_ENV_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), '.env')
+
 def get_env_path():
     """Get path to .env file in the project root."""
-    base_dir = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
-    return os.path.join(base_dir, '.env')
+    return _ENV_PATH
 
 
 def parse_env_file(filepath):
-    """Parse .env file and return list of (key, value) tuples."""
-    if not os.path.exists(filepath):
-        return []
-    
+    """Parse .env file and return list of (key, value) tuples.
+
+    Results are cached per path until the file's mtime or size changes.
+    """
     try:
-        env_dict = dotenv_values(filepath)
-        return list(env_dict.items())
-    except Exception as e:
-        logger.error(f"Error parsing .env file: {e}")
+        file_stat = os.stat(filepath)
+    except FileNotFoundError:
         return []
 
+    token = (file_stat.st_mtime_ns, file_stat.st_size)
+    with _ENV_LOCK:
+        cached = _ENV_CACHE.get(filepath)
+        if cached and cached[0] == token:
+            return list(cached[1])
+
+        try:
+            entries = _read_env_entries(filepath)
+        except Exception as e:
+            logger.error(f"Error parsing .env file: {e}")
+            return []
+
+        _ENV_CACHE[filepath] = (token, entries)
+        return list(entries)
+
+
+def _decode_escapes(regex, value):
+    """Decode the backslash escapes matched by regex, as python-dotenv does."""
+    return regex.sub(lambda m: codecs.decode(m.group(0), 'unicode-escape'), value)
+
+
+def _parse_env_value(raw):
+    """Parse the text after `=`, returning the value or None if a quote is left unclosed."""
+    value = raw.lstrip()
+    if not value:
+        return ''
+
+    if value[0] in ('"', "'"):
+        # Anything after the closing quote (e.g. an inline comment) is ignored
+        if value[0] == '"':
+            match = _DOUBLE_QUOTED_RE.match(value)
+            return _decode_escapes(_DOUBLE_ESCAPES_RE, match.group(1)) if match else None
+        match = _SINGLE_QUOTED_RE.match(value)
+        return _decode_escapes(_SINGLE_ESCAPES_RE, match.group(1)) if match else None
+
+    # `KEY= # comment` is an empty value, while `KEY=#value` keeps the `#`
+    if value[0] == '#' and value is not raw:
+        return ''
+    return _INLINE_COMMENT_RE.sub('', value).rstrip()
+
+
+def _read_env_entries(filepath):
+    """Read KEY=VALUE lines, honouring `export` prefixes, quotes, escapes and comments."""
+    entries = []
+    with open(filepath, 'r', encoding='utf-8', buffering=131072) as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith('#') or '=' not in line:
+                continue
+
+            key, raw = line.split('=', 1)
+            key = _EXPORT_RE.sub('', key.strip()).strip()
+            value = _parse_env_value(raw)
+            if value is None:
+                logger.warning(f"Skipping .env entry with an unterminated quote: {key}")
+                continue
+
+            entries.append((key, value))
+    return entries
+
+
+def _invalidate_env_cache(filepath):
+    """Drop the cached parse result for the given .env file."""
+    with _ENV_LOCK:
+        _ENV_CACHE.pop(filepath, None)
+
+
+def _copy_file_metadata(src, dst):
+    """Give dst the permission bits and, where allowed, the owner of an existing src.
+
+    A new .env keeps the temp file's owner-only (0600) mode.
+    """
+    try:
+        st = os.stat(src)
+    except FileNotFoundError:
+        return
+    os.chmod(dst, stat.S_IMODE(st.st_mode))
+    try:
+        os.chown(dst, st.st_uid, st.st_gid)
+    except (AttributeError, PermissionError):
+        # Only root can hand the file to another user; it then belongs to the service user
+        pass
+
 
 def write_env_file(filepath, entries):
-    """Write entries to .env file."""
+    """Write entries to .env file atomically in a single buffered write."""
+    parts = ["# InkyPi API Keys and Secrets\n", "# Managed via web interface\n\n"]
+    for key, value in entries:
+        # Quote values with spaces or special characters
+        if _NEEDS_QUOTE_RE.search(value):
+            value = '"' + value.replace('\\', '\\\\').replace('"', '\\"') + '"'
+        parts.append(f"{key}={value}\n")
+
+    # Replace the file a symlinked .env points to rather than the link itself
+    target = os.path.realpath(filepath)
+    tmp_path = None
     try:
-        with open(filepath, 'w') as f:
-            f.write("# InkyPi API Keys and Secrets\n")
-            f.write("# Managed via web interface\n\n")
-            for key, value in entries:
-                # Quote values with spaces or special characters
-                if ' ' in value or '"' in value or "'" in value:
-                    value = f'"{value}"'
-                f.write(f"{key}={value}\n")
+        with tempfile.NamedTemporaryFile('w', encoding='utf-8', buffering=131072, delete=False,
+                                         dir=os.path.dirname(target), prefix='.env.', suffix='.tmp') as f:
+            tmp_path = f.name
+            f.write("".join(parts))
+        _copy_file_metadata(target, tmp_path)
+        os.replace(tmp_path, target)
+        _invalidate_env_cache(filepath)
         return True
     except Exception as e:
         logger.error(f"Error writing .env file: {e}")
+        if tmp_path and os.path.exists(tmp_path):
+            os.remove(tmp_path)
         return False
 
 
@@ -48,7 +172,7 @@ def mask_value(value):
     """Mask API key value for display. Never reveal actual values for security."""
     if not value:
         return "(empty)"
-    return "●" * min(len(value), 20)
+    return _MASK[:len(value)]
 
 
 @apikeys_bp.route('/api-keys')
@@ -77,9 +201,10 @@ def save_apikeys():
         data = request.get_json()
         entries = data.get('entries', [])
         
-        # Load existing values for keys marked as keepExisting
+        # Load existing values only when some entry is marked as keepExisting
         env_path = get_env_path()
-        existing_values = dict(parse_env_file(env_path))
+        need_existing = any(entry.get('keepExisting') for entry in entries)
+        existing_values = dict(parse_env_file(env_path)) if need_existing else {}
         
         # Validate and process entries
         valid_entries = []
@@ -91,7 +216,7 @@ def save_apikeys():
                 continue
             
             # Validate key format
-            if not re.match(r'^[A-Za-z_][A-Za-z0-9_]*$', key):
+            if not _KEY_RE.match(key):
                 return jsonify({"error": f"Invalid key format: {key}"}), 400
             
             if keep_existing:
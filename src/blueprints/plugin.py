@@ -1,10 +1,13 @@
 from flask import Blueprint, request, jsonify, current_app, render_template, send_from_directory
 from plugins.plugin_registry import get_plugin_instance
+from plugins.base_plugin.base_plugin import BasePlugin
 from utils.app_utils import resolve_path, handle_request_files, parse_form
 from refresh_task import ManualRefresh, PlaylistRefresh
+from werkzeug.exceptions import NotFound
 import json
 import os
 import logging
+import threading
 
 logger = logging.getLogger(__name__)
 plugin_bp = Blueprint("plugin", __name__)
@@ -13,23 +16,37 @@ def _delete_plugin_instance_images(device_config, plugin_instance_obj):
     """Delete all images associated with a plugin instance."""
     # Delete the plugin instance's generated image
     plugin_image_path = os.path.join(device_config.plugin_image_dir, plugin_instance_obj.get_image_path())
-    if os.path.exists(plugin_image_path):
-        try:
-            os.remove(plugin_image_path)
-            logger.info(f"Deleted plugin instance image: {plugin_image_path}")
-        except Exception as e:
-            logger.warning(f"Failed to delete plugin instance image {plugin_image_path}: {e}")
+    try:
+        os.remove(plugin_image_path)
+        logger.info(f"Deleted plugin instance image: {plugin_image_path}")
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        logger.warning(f"Failed to delete plugin instance image {plugin_image_path}: {e}")
 
-    # Call the plugin's cleanup method to handle plugin-specific resource cleanup
+    # Call the plugin's cleanup method to handle plugin-specific resource cleanup,
+    # skipping plugins that inherit the no-op BasePlugin.cleanup
     try:
         plugin_config = device_config.get_plugin(plugin_instance_obj.plugin_id)
         if plugin_config:
             plugin = get_plugin_instance(plugin_config)
-            plugin.cleanup(plugin_instance_obj.settings)
+            if type(plugin).cleanup is not BasePlugin.cleanup:
+                plugin.cleanup(plugin_instance_obj.settings)
     except Exception as e:
         logger.warning(f"Error during plugin cleanup for {plugin_instance_obj.plugin_id}: {e}")
 
-# Removed module-level PLUGINS_DIR - will resolve dynamically in route handlers
+# Plugins directory is resolved lazily on first request, then reused
+_PLUGINS_DIR_ABS = None
+_PLUGINS_DIR_LOCK = threading.Lock()
+
+def _get_plugins_dir():
+    """Return the absolute plugins directory, resolving it once per process."""
+    global _PLUGINS_DIR_ABS
+    if _PLUGINS_DIR_ABS is None:
+        with _PLUGINS_DIR_LOCK:
+            if _PLUGINS_DIR_ABS is None:
+                _PLUGINS_DIR_ABS = os.path.abspath(resolve_path("plugins"))
+    return _PLUGINS_DIR_ABS
 
 @plugin_bp.route('/plugin/<plugin_id>')
 def plugin_page(plugin_id):
@@ -65,32 +82,23 @@ def plugin_page(plugin_id):
 
 @plugin_bp.route('/images/<plugin_id>/<path:filename>')
 def image(plugin_id, filename):
-    # Resolve plugins directory dynamically
-    plugins_dir = resolve_path("plugins")
+    plugins_dir = _get_plugins_dir()
 
     # Construct the full path to the plugin's file
-    plugin_dir = os.path.join(plugins_dir, plugin_id)
+    abs_plugin_dir = os.path.join(plugins_dir, plugin_id)
 
     # Security check to prevent directory traversal
-    safe_path = os.path.abspath(os.path.join(plugin_dir, filename))
-    if not safe_path.startswith(os.path.abspath(plugins_dir)):
+    safe_path = os.path.abspath(os.path.join(abs_plugin_dir, filename))
+    if os.path.commonpath([safe_path, plugins_dir]) != plugins_dir:
         return "Invalid path", 403
 
-    # Convert to absolute path for send_from_directory
-    abs_plugin_dir = os.path.abspath(plugin_dir)
-
-    # Check if the directory and file exist
-    if not os.path.isdir(abs_plugin_dir):
-        logger.error(f"Plugin directory not found: {abs_plugin_dir}")
-        return "Plugin directory not found", 404
-
-    if not os.path.isfile(safe_path):
+    # Serve the file from the plugin directory, plugin assets only change on update
+    try:
+        return send_from_directory(abs_plugin_dir, filename, max_age=3600, conditional=True)
+    except NotFound:
         logger.error(f"File not found: {safe_path}")
         return "File not found", 404
 
-    # Serve the file from the plugin directory
-    return send_from_directory(abs_plugin_dir, filename)
-
 @plugin_bp.route('/plugin_instance_image/<path:playlist_name>/<path:plugin_id>/<path:instance_name>')
 def plugin_instance_image(playlist_name, plugin_id, instance_name):
     """Serve the generated image for a plugin instance."""
@@ -106,54 +114,88 @@ def plugin_instance_image(playlist_name, plugin_id, instance_name):
     if not plugin_instance:
         return "Plugin instance not found", 404
 
-    # Get the image path
     image_filename = plugin_instance.get_image_path()
-    image_path = os.path.join(device_config.plugin_image_dir, image_filename)
 
-    # Check if the image exists
-    if not os.path.exists(image_path):
-        # Return a placeholder or 404
+    # Serve the image, always revalidating since it is regenerated on refresh
+    try:
+        return send_from_directory(device_config.plugin_image_dir, image_filename, max_age=0, conditional=True)
+    except NotFound:
         return "Image not yet generated", 404
 
-    # Serve the image
-    return send_from_directory(device_config.plugin_image_dir, image_filename)
+def _delete_plugin_instances(device_config, instances):
+    """Delete plugin instances from their playlists and write the config once.
 
-@plugin_bp.route('/delete_plugin_instance', methods=['POST'])
-def delete_plugin_instance():
-    device_config = current_app.config['DEVICE_CONFIG']
-    playlist_manager = device_config.get_playlist_manager()
+    Args:
+        instances: List of dicts with playlist_name, plugin_id and plugin_instance keys.
 
-    data = request.json
-    playlist_name = data.get("playlist_name")
-    plugin_id = data.get("plugin_id")
-    plugin_instance = data.get("plugin_instance")
+    Returns:
+        An error message if any instance could not be found (nothing is deleted), otherwise None.
+    """
+    playlist_manager = device_config.get_playlist_manager()
 
-    try:
-        playlist = playlist_manager.get_playlist(playlist_name)
+    # Resolve everything up front so a bad entry doesn't leave a partial delete
+    resolved = []
+    for entry in instances:
+        playlist = playlist_manager.get_playlist(entry.get("playlist_name"))
         if not playlist:
-            return jsonify({"success": False, "message": "Playlist not found"}), 400
+            return "Playlist not found"
 
-        # Get the plugin instance to find associated images
-        plugin_instance_obj = playlist.find_plugin(plugin_id, plugin_instance)
+        plugin_instance_obj = playlist.find_plugin(entry.get("plugin_id"), entry.get("plugin_instance"))
         if not plugin_instance_obj:
-            return jsonify({"success": False, "message": "Plugin instance not found"}), 400
+            return "Plugin instance not found"
+        resolved.append((playlist, plugin_instance_obj))
 
-        # Delete associated images before removing from playlist
+    # Delete associated images before removing from playlists
+    for _, plugin_instance_obj in resolved:
         _delete_plugin_instance_images(device_config, plugin_instance_obj)
 
-        result = playlist.delete_plugin(plugin_id, plugin_instance)
-        if not result:
-            return jsonify({"success": False, "message": "Plugin instance not found"}), 400
+    for playlist, plugin_instance_obj in resolved:
+        playlist.delete_plugin(plugin_instance_obj.plugin_id, plugin_instance_obj.name)
 
-        # save changes to device config file
-        device_config.write_config()
+    # save changes to device config file
+    device_config.write_config()
+    return None
 
+@plugin_bp.route('/delete_plugin_instance', methods=['POST'])
+def delete_plugin_instance():
+    device_config = current_app.config['DEVICE_CONFIG']
+
+    data = request.json
+    instance = {
+        "playlist_name": data.get("playlist_name"),
+        "plugin_id": data.get("plugin_id"),
+        "plugin_instance": data.get("plugin_instance"),
+    }
+
+    try:
+        error = _delete_plugin_instances(device_config, [instance])
+        if error:
+            return jsonify({"success": False, "message": error}), 400
     except Exception as e:
         logger.exception("EXCEPTION CAUGHT: " + str(e))
         return jsonify({"error": f"An error occurred: {str(e)}"}), 500
 
     return jsonify({"success": True, "message": "Deleted plugin instance."})
 
+@plugin_bp.route('/delete_plugin_instances', methods=['POST'])
+def delete_plugin_instances():
+    device_config = current_app.config['DEVICE_CONFIG']
+
+    data = request.json or {}
+    instances = data.get("instances", [])
+    if not isinstance(instances, list) or not all(isinstance(i, dict) for i in instances):
+        return jsonify({"success": False, "message": "Instances must be a list of objects"}), 400
+
+    try:
+        error = _delete_plugin_instances(device_config, instances)
+        if error:
+            return jsonify({"success": False, "message": error}), 400
+    except Exception as e:
+        logger.exception("EXCEPTION CAUGHT: " + str(e))
+        return jsonify({"error": f"An error occurred: {str(e)}"}), 500
+
+    return jsonify({"success": True, "message": f"Deleted {len(instances)} plugin instance(s)."})
+
 @plugin_bp.route('/update_plugin_instance/<string:instance_name>', methods=['PUT'])
 def update_plugin_instance(instance_name):
     device_config = current_app.config['DEVICE_CONFIG']
@@ -19,8 +19,12 @@ class Config:
     # Directory path for storing plugin instance images
     plugin_image_dir = os.path.join(BASE_DIR, "static", "images", "plugins")
 
+    # Directory path for on-disk caches that should survive restarts
+    cache_dir = os.path.join(BASE_DIR, "cache")
+
     def __init__(self):
         self.config = self.read_config()
+        self._effective_resolution = None
         self.plugins_list = self.read_plugins_list()
         self.playlist_manager = self.load_playlist_manager()
         self.refresh_info = self.load_refresh_info()
@@ -101,14 +105,26 @@ class Config:
         width, height = resolution
         return (int(width), int(height))
 
+    def get_effective_resolution(self):
+        """Returns the resolution as (width, height) as seen by plugins, swapped for vertical orientation."""
+        if self._effective_resolution is None:
+            width, height = self.get_resolution()
+            if self.get_config("orientation") == "vertical":
+                width, height = height, width
+            self._effective_resolution = (width, height)
+        return self._effective_resolution
+
     def update_config(self, config):
         """Updates the config with the new values provided and writes to the config file."""
         self.config.update(config)
+        self._effective_resolution = None
         self.write_config()
 
     def update_value(self, key, value, write=False):
         """Updates a specific key in the configuration with a new value and optionally writes it to the config file."""
         self.config[key] = value
+        if key in ("resolution", "orientation"):
+            self._effective_resolution = None
         if write:
             self.write_config()
 
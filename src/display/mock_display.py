@@ -1,4 +1,5 @@
 import os
+import shutil
 import logging
 from datetime import datetime
 from .abstract_display import AbstractDisplay
@@ -14,6 +15,8 @@ class MockDisplay(AbstractDisplay):
         self.width = resolution[0]
         self.height = resolution[1]
         self.output_dir = device_config.get_config('output_dir', 'mock_display_output')
+        # PNG zlib level (0-9), lower trades disk space for faster saves
+        self.compress_level = int(device_config.get_config('mock_compress_level', 1))
         os.makedirs(self.output_dir, exist_ok=True)
         
     def initialize_display(self):
@@ -23,7 +26,15 @@ class MockDisplay(AbstractDisplay):
     def display_image(self, image, image_settings=[]):
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         filepath = os.path.join(self.output_dir, f"display_{timestamp}.png")
-        image.save(filepath, "PNG")
+        image.save(filepath, "PNG", compress_level=self.compress_level)
         
-        # Also save as latest.png for convenience
-        image.save(os.path.join(self.output_dir, 'latest.png'), "PNG")
\ No newline at end of file
+        # Also expose as latest.png for convenience, linking instead of re-encoding
+        latest_path = os.path.join(self.output_dir, 'latest.png')
+        try:
+            os.remove(latest_path)
+        except FileNotFoundError:
+            pass
+        try:
+            os.link(filepath, latest_path)
+        except OSError:
+            shutil.copyfile(filepath, latest_path)
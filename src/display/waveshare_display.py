@@ -10,22 +10,37 @@ from plugins.plugin_registry import get_plugin_instance
 
 logger = logging.getLogger(__name__)
 
+# Colours the bi-color panels can show, in palette index order
+_BI_COLOR_RGB = ((0, 0, 0), (255, 255, 255), (255, 0, 0))
+
+def _build_bi_color_palette():
+    """Build the black/white/red palette image used to quantize bi-color frames."""
+    palette_img = Image.new('P', (1, 1))
+    palette_img.putpalette([channel for color in _BI_COLOR_RGB for channel in color])
+    return palette_img
+
+_BI_COLOR_PALETTE_IMG = _build_bi_color_palette()
+
+# Palette index -> 1-bit lookup tables, 0 (ink) where the index matches the layer colour
+_BLACK_LAYER_LUT = [0 if i == 0 else 1 for i in range(256)]
+_RED_LAYER_LUT = [0 if i == 2 else 1 for i in range(256)]
+
 
 def split_image_for_bi_color_epd(image):
     """
     Convert image into two 1-bit layers for bi-color (black and red) e-paper displays.
     """
-    black = (0, 0, 0)
-    white = (255, 255, 255)
-    red = (255, 0, 0)
-
-    palette_data = [*black, *white, *red]
-    palette_img = Image.new('P', (1, 1))
-    palette_img.putpalette(palette_data)
-
-    indexed_img = image.quantize(palette=palette_img, dither=Image.Dither.FLOYDSTEINBERG)
-    black_layer = indexed_img.point(lambda p: 0 if p == 0 else 1, mode='1')
-    red_layer = indexed_img.point(lambda p: 0 if p == 2 else 1, mode='1')
+    # Frames drawn only in black, white and red (text, calendars, etc.) are already
+    # in the panel palette and gain nothing from error diffusion, so map them directly.
+    # Any other colour, even a single flat fill, still needs dithering.
+    colors = image.getcolors(maxcolors=len(_BI_COLOR_RGB)) if image.mode == 'RGB' else None
+    if colors is not None and all(color in _BI_COLOR_RGB for _, color in colors):
+        dither = Image.Dither.NONE
+    else:
+        dither = Image.Dither.FLOYDSTEINBERG
+    indexed_img = image.quantize(palette=_BI_COLOR_PALETTE_IMG, dither=dither)
+    black_layer = indexed_img.point(_BLACK_LAYER_LUT, mode='1')
+    red_layer = indexed_img.point(_RED_LAYER_LUT, mode='1')
     return black_layer, red_layer
 
 
@@ -82,13 +97,15 @@ class WaveshareDisplay(AbstractDisplay):
 
             self.epd_display_init()
 
-            display_args_spec = inspect.getfullargspec(self.epd_display.display)
+            # Bound method, so `self` is excluded: (image) or (imageblack, imagered)
+            display_params = inspect.signature(self.epd_display.display).parameters
         except ModuleNotFoundError:
             raise ValueError(f"Unsupported Waveshare display type: {display_type}")
         except AttributeError:
             raise ValueError(f"Display does not support required methods: {display_type}")
 
-        self.bi_color_display = len(display_args_spec.args) > 2
+        self.bi_color_display = len(display_params) > 1
+        self.first_frame_displayed = False
 
         # update the resolution directly from the loaded device context
         if not self.device_config.get_config("resolution"):
@@ -123,8 +140,10 @@ class WaveshareDisplay(AbstractDisplay):
         # Assume device was in sleep mode.
         self.epd_display_init()
 
-        # Clear residual pixels before updating the image.
-        self.epd_display.Clear()
+        # Full-frame writes overwrite every pixel, so only clear residual pixels on the
+        # first frame after startup or when a plugin asks for it via "force-clear".
+        if not self.first_frame_displayed or "force-clear" in image_settings:
+            self.epd_display.Clear()
 
         # Display the image on the WS display.
         if not self.bi_color_display:
@@ -137,6 +156,8 @@ class WaveshareDisplay(AbstractDisplay):
                 self.epd_display.getbuffer(red_layer),
             )
 
+        self.first_frame_displayed = True
+
         # Put device into low power mode (EPD displays maintain image when powered off)
         logger.info("Putting Waveshare display into sleep mode for power saving.")
         self.epd_display.sleep()
@@ -3,8 +3,6 @@
 # set up logging
 import os, logging.config
 
-from pi_heif import register_heif_opener
-
 logging.config.fileConfig(os.path.join(os.path.dirname(__file__), 'config', 'logging.conf'))
 
 # suppress warning from inky library https://github.com/pimoroni/inky/issues/205
@@ -81,20 +79,25 @@ app.register_blueprint(plugin_bp)
 app.register_blueprint(playlist_bp)
 app.register_blueprint(apikeys_bp)
 
-# Register opener for HEIF/HEIC images
-register_heif_opener()
+def display_startup_image():
+    """Generate the startup image, show it and clear the startup flag."""
+    try:
+        img = generate_startup_image(device_config.get_resolution())
+        display_manager.display_image(img)
+        device_config.update_value("startup", False, write=True)
+    except Exception:
+        logger.exception("Failed to display startup image")
 
 if __name__ == '__main__':
 
     # start the background refresh task
     refresh_task.start()
 
-    # display default inkypi image on startup
+    # display default inkypi image on startup, in the background so the web server
+    # comes up while the image is rendered and written to the display
     if device_config.get_config("startup") is True:
         logger.info("Startup flag is set, displaying startup image")
-        img = generate_startup_image(device_config.get_resolution())
-        display_manager.display_image(img)
-        device_config.update_value("startup", False, write=True)
+        threading.Thread(target=display_startup_image, daemon=True).start()
 
     try:
         # Run the Flask app
@@ -11,10 +11,13 @@ from io import BytesIO
 from utils.http_client import get_http_session
 import logging
 from random import randint
-from datetime import datetime, timedelta
+from datetime import date
 
 logger = logging.getLogger(__name__)
 
+# Earliest date random APODs are picked from
+APOD_RANDOM_START_ORDINAL = date(2015, 1, 1).toordinal()
+
 class Apod(BasePlugin):
     def generate_settings_template(self):
         template_params = super().generate_settings_template()
@@ -38,10 +41,8 @@ class Apod(BasePlugin):
 
         # Determine date to fetch
         if settings.get("randomizeApod") == "true":
-            start = datetime(2015, 1, 1)
-            end = datetime.today()
-            delta_days = (end - start).days
-            random_date = start + timedelta(days=randint(0, delta_days))
+            delta_days = date.today().toordinal() - APOD_RANDOM_START_ORDINAL
+            random_date = date.fromordinal(APOD_RANDOM_START_ORDINAL + randint(0, delta_days))
             params["date"] = random_date.strftime("%Y-%m-%d")
             logger.info(f"Fetching random APOD from date: {params['date']}")
         elif settings.get("customDate"):
@@ -70,10 +71,7 @@ class Apod(BasePlugin):
         logger.debug(f"Using {'HD URL' if data.get('hdurl') else 'standard URL'}")
 
         # Get target dimensions
-        dimensions = device_config.get_resolution()
-        if device_config.get_config("orientation") == "vertical":
-            dimensions = dimensions[::-1]
-            logger.debug(f"Vertical orientation detected, dimensions: {dimensions[0]}x{dimensions[1]}")
+        dimensions = device_config.get_effective_resolution()
 
         # Use adaptive image loader for memory-efficient processing
         image = self.image_loader.from_url(image_url, dimensions, timeout_ms=40000)
@@ -1,5 +1,6 @@
 import os
 from utils.app_utils import resolve_path, get_font
+from utils.http_client import get_http_session
 from plugins.base_plugin.base_plugin import BasePlugin
 from plugins.calendar.constants import LOCALE_MAP, FONT_SIZES
 from PIL import Image, ImageColor, ImageDraw, ImageFont
@@ -7,7 +8,6 @@ import icalendar
 import recurring_ical_events
 from io import BytesIO
 import logging
-import requests
 from datetime import datetime, timedelta
 import pytz
 
@@ -36,9 +36,7 @@ class Calendar(BasePlugin):
             if not url.strip():
                 raise RuntimeError("Invalid calendar URL")
 
-        dimensions = device_config.get_resolution()
-        if device_config.get_config("orientation") == "vertical":
-            dimensions = dimensions[::-1]
+        dimensions = device_config.get_effective_resolution()
         
         timezone = device_config.get_config("timezone", default="America/New_York")
         time_format = device_config.get_config("time_format", default="12h")
@@ -142,7 +140,7 @@ class Calendar(BasePlugin):
         if calendar_url.startswith("webcal://"):
             calendar_url = calendar_url.replace("webcal://", "https://")
         try:
-            response = requests.get(calendar_url, timeout=30)
+            response = get_http_session().get(calendar_url, timeout=30)
             response.raise_for_status()
             return icalendar.Calendar.from_ical(response.text)
         except Exception as e:
@@ -37,10 +37,7 @@ class Comic(BasePlugin):
         if comic_panel.get("caption"):
             logger.debug(f"Comic caption: {comic_panel['caption']}")
 
-        dimensions = device_config.get_resolution()
-        if device_config.get_config("orientation") == "vertical":
-            dimensions = dimensions[::-1]
-            logger.debug(f"Vertical orientation detected, dimensions: {dimensions[0]}x{dimensions[1]}")
+        dimensions = device_config.get_effective_resolution()
 
         width, height = dimensions
 
@@ -63,12 +60,14 @@ class Comic(BasePlugin):
             raise RuntimeError("Failed to load comic image")
 
         with img:
-            background = Image.new("RGB", (width, height), "white")
-            font = get_font("Jost", font_size=int(caption_font_size))
-            draw = ImageDraw.Draw(background)
+            background = None
             top_padding, bottom_padding = 0, 0
 
             if is_caption:
+                background = Image.new("RGB", (width, height), "white")
+                font = get_font("Jost", font_size=int(caption_font_size))
+                draw = ImageDraw.Draw(background)
+
                 if comic_panel["title"]:
                     lines, wrapped_text = self._wrap_text(comic_panel["title"], font, width)
                     draw.multiline_text((width // 2, 0), wrapped_text, font=font, fill="black", anchor="ma")
@@ -81,7 +80,17 @@ class Comic(BasePlugin):
 
             scale = min(width / img.width, (height - top_padding - bottom_padding) / img.height)
             new_size = (int(img.width * scale), int(img.height * scale))
-            img = img.resize(new_size, Image.LANCZOS)
+            if scale < 0.5:
+                # Heavy downscale: cheap box reduction to 2x the target first
+                img.thumbnail((new_size[0] * 2, new_size[1] * 2), Image.BOX)
+            # Within 2x of the target LANCZOS's wider kernel costs more taps for no visible gain
+            img = img.resize(new_size, Image.BICUBIC)
+
+            if background is None:
+                # Nothing to letterbox or caption, so the resized panel is the frame
+                if img.size == (width, height):
+                    return img.convert("RGB")
+                background = Image.new("RGB", (width, height), "white")
 
             y_middle = (height - img.height) // 2
             y_top_bound = top_padding
@@ -95,13 +104,50 @@ class Comic(BasePlugin):
             return background
 
     def _wrap_text(self, text, font, width):
-        lines = []
-        words = text.split()[::-1]
+        words = text.split()
+        if not words:
+            return 0, ''
+
+        # Measure each word once; all fitting below works on these widths
+        space_width = font.getlength(' ')
+        widths = [font.getlength(word) for word in words]
+
+        # Greedy pass to find the fewest lines the text can fit on
+        line_count, line_width = 1, widths[0]
+        for word_width in widths[1:]:
+            if line_width + space_width + word_width < width:
+                line_width += space_width + word_width
+            else:
+                line_count += 1
+                line_width = word_width
+
+        # Optimal fit over that many lines: minimise the summed squared slack so
+        # lines come out evenly filled instead of leaving a short last line.
+        # cost[k][j] is the best cost of setting words[:j] on k lines.
+        word_count = len(words)
+        cost = [[float('inf')] * (word_count + 1) for _ in range(line_count + 1)]
+        start = [[0] * (word_count + 1) for _ in range(line_count + 1)]
+        cost[0][0] = 0
+
+        for k in range(1, line_count + 1):
+            for j in range(k, word_count + 1):
+                line_width = -space_width
+                for i in range(j - 1, k - 2, -1):
+                    line_width += space_width + widths[i]
+                    # A single over-long word still gets a line to itself
+                    if i < j - 1 and line_width >= width:
+                        break
+                    line_cost = cost[k - 1][i] + (width - line_width) ** 2
+                    if line_cost < cost[k][j]:
+                        cost[k][j] = line_cost
+                        start[k][j] = i
 
-        while words:
-            line = words.pop()
-            while words and font.getbbox(line + ' ' + words[-1])[2] < width:
-                line += ' ' + words.pop()
-            lines.append(line)
+        lines = []
+        j = word_count
+        for k in range(line_count, 0, -1):
+            i = start[k][j]
+            lines.append(' '.join(words[i:j]))
+            j = i
+        lines.reverse()
 
         return len(lines), '\n'.join(lines)
@@ -2,76 +2,121 @@ import feedparser
 import html
 import re
 
+from functools import lru_cache
+
+from utils.http_client import get_http_session
+
+_IMG_TAG_RE = re.compile(r'<img\b[^>]*>')
+_ATTR_RE = re.compile(r'([A-Za-z_:][-\w:.]*)\s*=\s*"([^"]*)"')
+_SMBC_HOVERTEXT_RE = re.compile(r'Hovertext:<br />(.*?)</p>')
+_DINO_TITLE_RE = re.compile(r'title="(.*?)" />')
+
+
+@lru_cache(maxsize=16)
+def _first_img_attrs(element):
+    """Attributes of the first <img> tag in an HTML snippet, scanned once per element."""
+    tag = _IMG_TAG_RE.search(element)
+    if not tag:
+        return {}
+    return {name.lower(): value for name, value in _ATTR_RE.findall(tag.group(0))}
+
 
 COMICS = {
     "XKCD": {
         "feed": "https://xkcd.com/atom.xml",
         "element": lambda feed: feed.entries[0].description,
-        "url": lambda element: re.search(r'<img[^>]+src=["\"]([^"\"]+)["\"]', element).group(1),
+        "url": lambda element: _first_img_attrs(element)["src"],
         "title": lambda feed: feed.entries[0].title,
-        "caption": lambda element: re.search(r'<img[^>]+alt=["\"]([^"\"]+)["\"]', element).group(1),
+        "caption": lambda element: _first_img_attrs(element)["alt"],
     },
     "Cyanide & Happiness": {
         "feed": "https://explosm-1311.appspot.com/",
         "element": lambda feed: feed.entries[0].description,
-        "url": lambda element: re.search(r'<img[^>]+src=["\"]([^"\"]+)["\"]', element).group(1),
+        "url": lambda element: _first_img_attrs(element)["src"],
         "title": lambda feed: feed.entries[0].title.split(" - ")[1].strip(),
         "caption": lambda element: "",
     },
     "Saturday Morning Breakfast Cereal": {
         "feed": "http://www.smbc-comics.com/comic/rss",
         "element": lambda feed: feed.entries[0].description,
-        "url": lambda element: re.search(r'<img[^>]+src=["\"]([^"\"]+)["\"]', element).group(1),
+        "url": lambda element: _first_img_attrs(element)["src"],
         "title": lambda feed: feed.entries[0].title.split("-")[1].strip(),
-        "caption": lambda element: re.search(r'Hovertext:<br />(.*?)</p>', element).group(1),
+        "caption": lambda element: _SMBC_HOVERTEXT_RE.search(element).group(1),
     },
     "The Perry Bible Fellowship": {
         "feed": "https://pbfcomics.com/feed/",
         "element": lambda feed: feed.entries[0].description,
-        "url": lambda element: re.search(r'<img[^>]+src=["\"]([^"\"]+)["\"]', element).group(1),
+        "url": lambda element: _first_img_attrs(element)["src"],
         "title": lambda feed: feed.entries[0].title,
-        "caption": lambda element: re.search(r'<img[^>]+alt=["\"]([^"\"]+)["\"]', element).group(1),
+        "caption": lambda element: _first_img_attrs(element)["alt"],
     },
     "Questionable Content": {
         "feed": "http://www.questionablecontent.net/QCRSS.xml",
         "element": lambda feed: feed.entries[0].description,
-        "url": lambda element: re.search(r'<img[^>]+src=["\"]([^"\"]+)["\"]', element).group(1),
+        "url": lambda element: _first_img_attrs(element)["src"],
         "title": lambda feed: feed.entries[0].title,
         "caption": lambda element: "",
     },
     "Poorly Drawn Lines": {
         "feed": "https://poorlydrawnlines.com/feed/",
         "element": lambda feed: feed.entries[0].get('content', [{}])[0].get('value', ''),
-        "url": lambda element: re.search(r'<img[^>]+src=["\"]([^"\"]+)["\"]', element).group(1),
+        "url": lambda element: _first_img_attrs(element)["src"],
         "title": lambda feed: feed.entries[0].title,
         "caption": lambda element: "",
     },
     "Dinosaur Comics": {
         "feed": "https://www.qwantz.com/rssfeed.php",
         "element": lambda feed: feed.entries[0].description,
-        "url": lambda element: re.search(r'<img[^>]+src=["\"]([^"\"]+)["\"]', element).group(1),
+        "url": lambda element: _first_img_attrs(element)["src"],
         "title": lambda feed: feed.entries[0].title,
-        "caption": lambda element: re.search(r'title="(.*?)" />', element.replace('\n', '')).group(1),
+        "caption": lambda element: _DINO_TITLE_RE.search(element.replace('\n', '')).group(1),
     },
     "webcomic name": {
         "feed": "https://webcomicname.com/rss",
         "element": lambda feed: feed.entries[0].description,
-        "url": lambda element: re.search(r'<img[^>]+src=["\"]([^"\"]+)["\"]', element).group(1),
+        "url": lambda element: _first_img_attrs(element)["src"],
         "title": lambda feed: "",
         "caption": lambda element: "",
     },
 }
 
 
+# Latest parsed panel per feed URL, with the validators needed to revalidate it
+_FEED_CACHE = {}
+
+
 def get_panel(comic_name):
-    feed = feedparser.parse(COMICS[comic_name]["feed"])
+    feed_url = COMICS[comic_name]["feed"]
+    cached = _FEED_CACHE.get(feed_url)
+
+    headers = {}
+    if cached:
+        if cached["etag"]:
+            headers["If-None-Match"] = cached["etag"]
+        if cached["modified"]:
+            headers["If-Modified-Since"] = cached["modified"]
+
+    # Fetch through the shared session so feed requests reuse pooled connections
+    response = get_http_session().get(feed_url, headers=headers, timeout=30)
+    if response.status_code == 304 and cached:
+        return dict(cached["panel"])
+    response.raise_for_status()
+
+    feed = feedparser.parse(response.content)
     try:
         element = COMICS[comic_name]["element"](feed)
     except IndexError:
         raise RuntimeError("Failed to retrieve latest comic.")
 
-    return {
+    panel = {
         "image_url": COMICS[comic_name]["url"](element),
         "title": html.unescape(COMICS[comic_name]["title"](feed)),
         "caption": html.unescape(COMICS[comic_name]["caption"](element)),
     }
+
+    etag = response.headers.get("ETag")
+    modified = response.headers.get("Last-Modified")
+    if etag or modified:
+        _FEED_CACHE[feed_url] = {"etag": etag, "modified": modified, "panel": panel}
+
+    return dict(panel)
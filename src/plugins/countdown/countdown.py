@@ -1,6 +1,6 @@
 from plugins.base_plugin.base_plugin import BasePlugin
 from PIL import Image
-from datetime import datetime, timezone
+from datetime import date, datetime
 import logging
 import pytz
 
@@ -18,18 +18,15 @@ class Countdown(BasePlugin):
         if not countdown_date_str:
             raise RuntimeError("Date is required.")
 
-        dimensions = device_config.get_resolution()
-        if device_config.get_config("orientation") == "vertical":
-            dimensions = dimensions[::-1]
+        dimensions = device_config.get_effective_resolution()
         
         timezone = device_config.get_config("timezone", default="America/New_York")
-        tz = pytz.timezone(timezone)
-        current_time = datetime.now(tz)
+        today = datetime.now(pytz.timezone(timezone)).date()
 
-        countdown_date = datetime.strptime(countdown_date_str, "%Y-%m-%d")
-        countdown_date = tz.localize(countdown_date)
+        # Only whole days matter, so compare plain dates instead of localizing the target
+        countdown_date = date.fromisoformat(countdown_date_str)
 
-        day_count = (countdown_date.date() - current_time.date()).days
+        day_count = (countdown_date - today).days
         label = "Days Left" if day_count > 0 else "Days Passed"
 
         template_params = {
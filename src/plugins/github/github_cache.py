@@ -0,0 +1,36 @@
+"""
+In-memory cache for GitHub API responses shared by the GitHub plugin views.
+
+GraphQL responses are reused for a short TTL, since the contribution calendar
+and sponsor list change far less often than the display refreshes. REST
+responses keep their ETag so they can be revalidated with If-None-Match.
+"""
+
+import threading
+import time
+
+# How long a cached GraphQL response is served before it is fetched again
+CACHE_TTL_SECONDS = 600
+
+_CACHE = {}
+_CACHE_LOCK = threading.Lock()
+
+
+def get_entry(key):
+    """Return the cached entry dict for key ({"value", "etag", "fetched_at"}), or None."""
+    with _CACHE_LOCK:
+        return _CACHE.get(key)
+
+
+def get_fresh(key, ttl=CACHE_TTL_SECONDS):
+    """Return the cached value for key if it was stored less than ttl seconds ago, else None."""
+    entry = get_entry(key)
+    if entry and time.monotonic() - entry["fetched_at"] < ttl:
+        return entry["value"]
+    return None
+
+
+def put(key, value, etag=None):
+    """Store value for key, stamped with the current time."""
+    with _CACHE_LOCK:
+        _CACHE[key] = {"value": value, "etag": etag, "fetched_at": time.monotonic()}
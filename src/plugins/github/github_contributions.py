@@ -1,9 +1,13 @@
-import requests
 import logging
-from datetime import datetime, date, timedelta
+from datetime import date, timedelta
+
+from . import github_cache
+from utils.http_client import get_http_session
 
 logger = logging.getLogger(__name__)
 
+MONTH_ABBR = ('Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec')
+
 GRAPHQL_QUERY = """
 query($username: String!) {
   user(login: $username) {
@@ -23,9 +27,7 @@ query($username: String!) {
 """
 
 def contributions_generate_image(plugin_instance, settings, device_config):
-    dimensions = device_config.get_resolution()
-    if device_config.get_config("orientation") == "vertical":
-        dimensions = dimensions[::-1]
+    dimensions = device_config.get_effective_resolution()
 
     api_key = device_config.load_env_key("GITHUB_SECRET")
     if not api_key:
@@ -37,8 +39,7 @@ def contributions_generate_image(plugin_instance, settings, device_config):
         raise RuntimeError("GitHub username is required.")
 
     data = fetch_contributions(github_username, api_key)
-    grid, month_positions = parse_contributions(data, colors)
-    metrics = calculate_metrics(data)
+    grid, month_positions, metrics = process_contributions(data, colors)
 
     template_params = {
         "username": github_username,
@@ -60,69 +61,82 @@ def contributions_generate_image(plugin_instance, settings, device_config):
 # -------------------------
 
 def fetch_contributions(username, api_key):
+    cache_key = ("contributions", username, api_key)
+    cached = github_cache.get_fresh(cache_key)
+    if cached is not None:
+        logger.debug(f"Using cached contributions data for {username}")
+        return cached
+
     url = "https://api.github.com/graphql"
     headers = {"Authorization": f"Bearer {api_key}"}
     variables = {"username": username}
-    resp = requests.post(url, json={"query": GRAPHQL_QUERY, "variables": variables}, headers=headers, timeout=30)
+    resp = get_http_session().post(url, json={"query": GRAPHQL_QUERY, "variables": variables}, headers=headers, timeout=30)
     resp.raise_for_status()
-    return resp.json()
-
-def parse_contributions(data, colors):
-    weeks = data["data"]["user"]["contributionsCollection"]["contributionCalendar"]["weeks"]
-
-    grid = [list(week["contributionDays"]) for week in weeks]
-    max_contrib = max(day["contributionCount"] for week in grid for day in week)
-
-    def get_color(count):
-        if max_contrib == 0 or count == 0:
-            return colors[0]
-        level = int((count / max_contrib) * (len(colors) - 1))
-        return colors[max(1, level)]
+    data = resp.json()
 
-    for week in grid:
-        for day in week:
-            day["color"] = get_color(day["contributionCount"])
+    github_cache.put(cache_key, data)
+    return data
 
-    month_positions = []
-    seen_months = set()
-    for i, week in enumerate(weeks):
-        first_day = week["contributionDays"][0]["date"]
-        dt = datetime.strptime(first_day, "%Y-%m-%d")
-        month_year = f"{dt.strftime('%b')}-{dt.year}"
-        if month_year not in seen_months:
-            month_positions.append({"name": dt.strftime("%b"), "index": i})
-            seen_months.add(month_year)
-
-    if month_positions:
-        month_positions.pop(0)
-
-    return grid, month_positions
-
-def calculate_metrics(data):
+def process_contributions(data, colors):
+    """Build the per-day grid, month labels and summary metrics in one walk of the calendar."""
     weeks = data["data"]["user"]["contributionsCollection"]["contributionCalendar"]["weeks"]
-    days = [day for week in weeks for day in week["contributionDays"]]
-    days = sorted(days, key=lambda d: d["date"])
 
-    total = sum(day["contributionCount"] for day in days)
+    # Flatten the calendar into parallel per-day lists; each week holds the
+    # indices of its days so the template can index them directly
+    dates, counts, week_days = [], [], []
+    for week in weeks:
+        start = len(dates)
+        for day in week["contributionDays"]:
+            dates.append(day["date"])
+            counts.append(day["contributionCount"])
+        week_days.append(range(start, len(dates)))
+
+    # Resolve each distinct count to its colour once: zero stays at level 0,
+    # any contribution gets at least level 1
+    max_contrib = max(counts, default=0)
+    color_lut = {0: colors[0]}
+    for count in set(counts) - {0}:
+        color_lut[count] = colors[max(1, count * (len(colors) - 1) // max_contrib)]
+
+    # The calendar is returned in chronological order, so streaks can be
+    # tracked in the same pass that assigns colours
     streak, longest_streak, current_streak = 0, 0, 0
     today = date.today()
-    yesterday = today - timedelta(days=1)
+    recent_dates = (today.isoformat(), (today - timedelta(days=1)).isoformat())
     in_current_streak = False
 
-    for day in days:
-        day_date = date.fromisoformat(day["date"])
-        if day["contributionCount"] > 0:
+    day_colors = []
+    for day_date, count in zip(dates, counts):
+        day_colors.append(color_lut[count])
+
+        if count > 0:
             streak += 1
             longest_streak = max(longest_streak, streak)
-            if day_date in (today, yesterday) or in_current_streak:
+            if day_date in recent_dates or in_current_streak:
                 current_streak = streak
                 in_current_streak = True
         else:
             streak = 0
             in_current_streak = False
 
-    return [
-        {"title": "Contributions", "value": total},
+    grid = {"weeks": week_days, "dates": dates, "counts": counts, "colors": day_colors}
+
+    month_positions = []
+    seen_months = set()
+    for i, days in enumerate(week_days):
+        # Dates are always YYYY-MM-DD, so the month-year key is just the prefix
+        month_year = dates[days[0]][:7]
+        if month_year not in seen_months:
+            month_positions.append({"name": MONTH_ABBR[int(month_year[5:7]) - 1], "index": i})
+            seen_months.add(month_year)
+
+    if month_positions:
+        month_positions.pop(0)
+
+    metrics = [
+        {"title": "Contributions", "value": sum(counts)},
         {"title": "Current Streak", "value": current_streak},
         {"title": "Longest Streak", "value": longest_streak},
     ]
+
+    return grid, month_positions, metrics
@@ -1,6 +1,8 @@
-import requests
 import logging
 
+from . import github_cache
+from utils.http_client import get_http_session
+
 logger = logging.getLogger(__name__)
 
 GRAPHQL_QUERY = """
@@ -32,9 +34,7 @@ query($username: String!) {
 """
 
 def sponsors_generate_image(plugin_instance, settings, device_config):
-    dimensions = device_config.get_resolution()
-    if device_config.get_config("orientation") == "vertical":
-        dimensions = dimensions[::-1]
+    dimensions = device_config.get_effective_resolution()
 
     api_key = device_config.load_env_key("GITHUB_SECRET")
     if not api_key:
@@ -65,11 +65,17 @@ def sponsors_generate_image(plugin_instance, settings, device_config):
 # -------------------------
 
 def fetch_sponsorships(username, api_key):
+    cache_key = ("sponsors", username, api_key)
+    cached = github_cache.get_fresh(cache_key)
+    if cached is not None:
+        logger.debug(f"Using cached sponsors data for {username}")
+        return cached
+
     url = "https://api.github.com/graphql"
     headers = {"Authorization": f"Bearer {api_key}"}
     variables = {"username": username}
 
-    resp = requests.post(url, json={"query": GRAPHQL_QUERY, "variables": variables}, headers=headers, timeout=30)
+    resp = get_http_session().post(url, json={"query": GRAPHQL_QUERY, "variables": variables}, headers=headers, timeout=30)
     resp.raise_for_status()
     data = resp.json()
 
@@ -77,6 +83,7 @@ def fetch_sponsorships(username, api_key):
         raise RuntimeError(f"GitHub API returned errors: {data['errors']}")
 
     logger.debug(f"Fetched sponsor data for {username}: {data}")
+    github_cache.put(cache_key, data)
     return data
 
 def calculate_monthly_total(data) -> int:
@@ -1,5 +1,7 @@
 import logging
-import requests
+
+from . import github_cache
+from utils.http_client import get_http_session
 
 logger = logging.getLogger(__name__)
 
@@ -7,9 +9,7 @@ def stars_generate_image(plugin_instance, settings, device_config):
     username = settings.get('githubUsername')
     repository = settings.get('githubRepository')
 
-    dimensions = device_config.get_resolution()
-    if device_config.get_config("orientation") == "vertical":
-        dimensions = dimensions[::-1]
+    dimensions = device_config.get_effective_resolution()
 
     github_repository = username + "/" + repository
     if not github_repository:
@@ -38,12 +38,20 @@ def fetch_stars(github_repository):
     url = f"https://api.github.com/repos/{github_repository}"
     headers = {"Accept": "application/json"}
 
-    response = requests.get(url, headers=headers, timeout=30)
-    if response.status_code == 200:
-        data = response.json()
-    else:
+    # Revalidate with the stored ETag; a 304 does not count against the rate limit
+    cache_key = ("stars", github_repository)
+    cached = github_cache.get_entry(cache_key)
+    if cached and cached["etag"]:
+        headers["If-None-Match"] = cached["etag"]
+
+    response = get_http_session().get(url, headers=headers, timeout=30)
+    if response.status_code == 304 and cached:
+        return cached["value"]
+    if response.status_code != 200:
         logger.error(f"GitHub Stars Plugin: Error: {response.status_code} - {response.text}")
-        data = {"stargazers_count": 0}
+        raise RuntimeError(f"GitHub returned status {response.status_code} for {github_repository}")
 
-    return data['stargazers_count']
+    stars = response.json()['stargazers_count']
+    github_cache.put(cache_key, stars, response.headers.get("ETag"))
+    return stars
 
@@ -1,13 +1,27 @@
 import logging
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import count
 from random import choice
 
-from PIL import Image, ImageColor, ImageOps
+from PIL import Image, ImageOps
 from utils.http_client import get_http_session
 from plugins.base_plugin.base_plugin import BasePlugin
-from utils.image_utils import pad_image_blur
+from utils.image_utils import get_background_color, pad_image_blur, pick_resample_filter, prescale_image
 
 logger = logging.getLogger(__name__)
 
+ASSET_PAGE_SIZE = 1000
+# Number of asset pages requested concurrently once an album spans several pages
+ASSET_PAGE_WORKERS = 4
+
+# Album asset lists change on human timescales, so reuse them across renders
+ALBUM_CACHE_TTL_SECONDS = 1800
+_ALBUM_CACHE = {}
+# Album name -> id map per server, revalidated with the list's ETag
+_ALBUM_IDS_CACHE = {}
+
 
 class ImmichProvider:
     def __init__(self, base_url: str, key: str, image_loader):
@@ -19,36 +33,75 @@ class ImmichProvider:
 
     def get_album_id(self, album: str) -> str:
         logger.debug(f"Fetching albums from {self.base_url}")
-        r = self.session.get(f"{self.base_url}/api/albums", headers=self.headers)
-        r.raise_for_status()
-        albums = r.json()
-
-        matching_albums = [a for a in albums if a["albumName"] == album]
-        if not matching_albums:
+        cache_key = (self.base_url, self.key)
+        cached = _ALBUM_IDS_CACHE.get(cache_key)
+
+        # Revalidate the album list so an unchanged list comes back as an empty 304
+        headers = self.headers
+        if cached:
+            headers = {**self.headers, "If-None-Match": cached["etag"]}
+
+        r = self.session.get(f"{self.base_url}/api/albums", headers=headers)
+        if r.status_code == 304 and cached:
+            album_ids = cached["album_ids"]
+        else:
+            r.raise_for_status()
+            album_ids = {}
+            for a in r.json():
+                album_ids.setdefault(a["albumName"], a["id"])
+
+            etag = r.headers.get("ETag")
+            if etag:
+                _ALBUM_IDS_CACHE[cache_key] = {"etag": etag, "album_ids": album_ids}
+
+        if album not in album_ids:
             raise RuntimeError(f"Album '{album}' not found.")
 
-        return matching_albums[0]["id"]
+        return album_ids[album]
+
+    def _get_assets_page(self, album_id: str, page: int) -> tuple[list[dict], bool]:
+        """Fetch one page of album assets, returning the items and whether more pages follow."""
+        body = {
+            "albumIds": [album_id],
+            "size": ASSET_PAGE_SIZE,
+            "page": page,
+            "withExif": False,
+            "withPeople": False
+        }
+        r = self.session.post(f"{self.base_url}/api/search/metadata", json=body, headers=self.headers)
+        r.raise_for_status()
+        assets_data = r.json().get("assets", {})
+
+        # Only the asset id is used, so drop the rest of the metadata straight away
+        page_items = [{"id": item["id"]} for item in assets_data.get("items", [])]
+        # Servers reporting nextPage let us stop without requesting a trailing empty page
+        if "nextPage" in assets_data:
+            return page_items, assets_data["nextPage"] is not None
+        return page_items, bool(page_items)
 
     def get_assets(self, album_id: str) -> list[dict]:
         """Fetch all assets from album."""
-        all_items = []
-        page_items = [1]
-        page = 1
-
         logger.debug(f"Fetching assets from album {album_id}")
-        while page_items:
-            body = {
-                "albumIds": [album_id],
-                "size": 1000,
-                "page": page
-            }
-            r2 = self.session.post(f"{self.base_url}/api/search/metadata", json=body, headers=self.headers)
-            r2.raise_for_status()
-            assets_data = r2.json()
-
-            page_items = assets_data.get("assets", {}).get("items", [])
-            all_items.extend(page_items)
-            page += 1
+        all_items, has_more = self._get_assets_page(album_id, 1)
+
+        if has_more:
+            # Keep a window of page requests in flight, consuming them in page order
+            # and topping the window up as each one is consumed
+            with ThreadPoolExecutor(max_workers=ASSET_PAGE_WORKERS) as executor:
+                pages = count(2)
+                in_flight = deque(
+                    executor.submit(self._get_assets_page, album_id, next(pages))
+                    for _ in range(ASSET_PAGE_WORKERS)
+                )
+                while has_more:
+                    page_items, has_more = in_flight.popleft().result()
+                    all_items.extend(page_items)
+                    if has_more:
+                        in_flight.append(executor.submit(self._get_assets_page, album_id, next(pages)))
+
+                # Pages queued past the end are not needed
+                for future in in_flight:
+                    future.cancel()
 
         logger.debug(f"Found {len(all_items)} total assets in album")
         return all_items
@@ -65,19 +118,28 @@ class ImmichProvider:
         Returns:
             PIL Image or None on error
         """
-        try:
-            logger.info(f"Getting id for album '{album}'")
-            album_id = self.get_album_id(album)
-            logger.info(f"Getting assets from album id {album_id}")
-            assets = self.get_assets(album_id)
-
-            if not assets:
-                logger.error(f"No assets found in album '{album}'")
+        cache_key = (self.base_url, self.key, album)
+        cached = _ALBUM_CACHE.get(cache_key)
+        if cached and time.monotonic() - cached["fetched_at"] < ALBUM_CACHE_TTL_SECONDS:
+            logger.info(f"Using cached asset list for album '{album}'")
+            assets = cached["assets"]
+        else:
+            try:
+                logger.info(f"Getting id for album '{album}'")
+                album_id = self.get_album_id(album)
+                logger.info(f"Getting assets from album id {album_id}")
+                assets = self.get_assets(album_id)
+
+                if not assets:
+                    logger.error(f"No assets found in album '{album}'")
+                    return None
+
+            except Exception as e:
+                _ALBUM_CACHE.pop(cache_key, None)
+                logger.error(f"Error retrieving album data from {self.base_url}: {e}")
                 return None
 
-        except Exception as e:
-            logger.error(f"Error retrieving album data from {self.base_url}: {e}")
-            return None
+            _ALBUM_CACHE[cache_key] = {"assets": assets, "fetched_at": time.monotonic()}
 
         # Select random asset
         selected_asset = choice(assets)
@@ -98,6 +160,8 @@ class ImmichProvider:
         )
 
         if not img:
+            # The asset may have been removed from the album; refetch the list next time
+            _ALBUM_CACHE.pop(cache_key, None)
             logger.error(f"Failed to load image {asset_id} from Immich")
             return None
 
@@ -118,12 +182,7 @@ class ImageAlbum(BasePlugin):
     def generate_image(self, settings, device_config):
         logger.info("=== Image Album Plugin: Starting image generation ===")
 
-        orientation = device_config.get_config("orientation")
-        dimensions = device_config.get_resolution()
-
-        if orientation == "vertical":
-            dimensions = dimensions[::-1]
-            logger.debug(f"Vertical orientation detected, dimensions: {dimensions[0]}x{dimensions[1]}")
+        dimensions = device_config.get_effective_resolution()
 
         img = None
         album_provider = settings.get("albumProvider")
@@ -175,11 +234,9 @@ class ImageAlbum(BasePlugin):
             if background_option == "blur":
                 img = pad_image_blur(img, dimensions)
             else:
-                background_color = ImageColor.getcolor(
-                    settings.get('backgroundColor') or "white",
-                    img.mode
-                )
-                img = ImageOps.pad(img, dimensions, color=background_color, method=Image.Resampling.LANCZOS)
+                background_color = get_background_color(settings.get('backgroundColor'), img.mode)
+                img = prescale_image(img, dimensions)
+                img = ImageOps.pad(img, dimensions, color=background_color, method=pick_resample_filter(img.size, dimensions))
         # else: loader already resized to fit with proper aspect ratio
 
         logger.info("=== Image Album Plugin: Image generation complete ===")
@@ -1,22 +1,57 @@
 from plugins.base_plugin.base_plugin import BasePlugin
-from PIL import Image, ImageOps, ImageColor
+from PIL import ImageOps
 import logging
 import os
 import random
 
-from utils.image_utils import pad_image_blur
+from utils.image_cache import file_cache_key, resized_image_cache
+from utils.image_utils import get_background_color, pad_image_blur, pick_resample_filter, prescale_image
 
 logger = logging.getLogger(__name__)
 
+IMAGE_EXTENSIONS = frozenset({'.avif', '.jpg', '.jpeg', '.png', '.gif', '.bmp', '.tiff', '.webp', '.heif', '.heic'})
+
+# Folder scan results by path: the mtime of every directory walked, plus the image list
+_FOLDER_CACHE = {}
+
+
+def _folder_unchanged(dir_mtimes):
+    """Adding, removing or renaming a file updates its directory's mtime, so equal mtimes mean the same listing."""
+    try:
+        return all(os.stat(d).st_mtime_ns == mtime for d, mtime in dir_mtimes.items())
+    except OSError:
+        return False
+
+
 def list_files_in_folder(folder_path):
     """Return a list of image file paths in the given folder, excluding hidden files."""
-    image_extensions = ('.avif', '.jpg', '.jpeg', '.png', '.gif', '.bmp', '.tiff', '.webp', '.heif', '.heic')
-    image_files = []
-    for root, dirs, files in os.walk(folder_path):
-        for f in files:
-            if f.lower().endswith(image_extensions) and not f.startswith('.'):
-                image_files.append(os.path.join(root, f))
+    cached = _FOLDER_CACHE.get(folder_path)
+    if cached and _folder_unchanged(cached["dir_mtimes"]):
+        return cached["files"]
 
+    image_files = []
+    dir_mtimes = {}
+    # Explicit scandir walk: DirEntry already knows whether each entry is a directory
+    stack = [folder_path]
+    while stack:
+        root = stack.pop()
+        try:
+            dir_mtimes[root] = os.stat(root).st_mtime_ns
+            with os.scandir(root) as entries:
+                for entry in entries:
+                    if entry.is_dir():
+                        # Like os.walk, symlinked directories are not descended into
+                        if not entry.is_symlink():
+                            stack.append(entry.path)
+                    else:
+                        name = entry.name
+                        # Lower-case only the extension rather than the whole file name
+                        if not name.startswith('.') and name[name.rfind('.'):].lower() in IMAGE_EXTENSIONS:
+                            image_files.append(entry.path)
+        except OSError:
+            continue
+
+    _FOLDER_CACHE[folder_path] = {"dir_mtimes": dir_mtimes, "files": image_files}
     return image_files
 
 class ImageFolder(BasePlugin):
@@ -36,10 +71,7 @@ class ImageFolder(BasePlugin):
             logger.error(f"Path is not a directory: {folder_path}")
             raise RuntimeError(f"Path is not a directory: {folder_path}")
 
-        dimensions = device_config.get_resolution()
-        if device_config.get_config("orientation") == "vertical":
-            dimensions = dimensions[::-1]
-            logger.debug(f"Vertical orientation detected, dimensions: {dimensions[0]}x{dimensions[1]}")
+        dimensions = device_config.get_effective_resolution()
 
         logger.info(f"Scanning folder: {folder_path}")
         image_files = list_files_in_folder(folder_path)
@@ -58,6 +90,12 @@ class ImageFolder(BasePlugin):
         background_option = settings.get('backgroundOption', 'blur')
         logger.debug(f"Settings: pad_image={use_padding}, background_option={background_option}")
 
+        cache_key = file_cache_key(image_url, tuple(dimensions), use_padding and background_option,
+                                   use_padding and settings.get('backgroundColor'))
+        cached_img = resized_image_cache.get(cache_key) if cache_key else None
+        if cached_img is not None:
+            return cached_img
+
         try:
             # Use adaptive loader for memory-efficient processing
             # Load without auto-resize first to handle padding options
@@ -67,18 +105,23 @@ class ImageFolder(BasePlugin):
             if not img:
                 raise RuntimeError("Failed to load image from file")
 
+            # Cheap box reduction first so the final resample below filters fewer pixels
+            img = prescale_image(img, dimensions)
+
             if use_padding:
                 logger.debug(f"Applying padding with {background_option} background")
                 if background_option == "blur":
                     img = pad_image_blur(img, dimensions)
                 else:
-                    background_color = ImageColor.getcolor(settings.get('backgroundColor') or "white", img.mode)
-                    img = ImageOps.pad(img, dimensions, color=background_color, method=Image.Resampling.LANCZOS)
+                    background_color = get_background_color(settings.get('backgroundColor'), img.mode)
+                    img = ImageOps.pad(img, dimensions, color=background_color, method=pick_resample_filter(img.size, dimensions))
             else:
                 # No padding requested, scale to fit dimensions (crop to preserve aspect ratio)
                 logger.debug(f"Scaling to fit dimensions: {dimensions[0]}x{dimensions[1]}")
-                img = ImageOps.fit(img, dimensions, method=Image.LANCZOS)
+                img = ImageOps.fit(img, dimensions, method=pick_resample_filter(img.size, dimensions))
 
+            if cache_key:
+                resized_image_cache.put(cache_key, img)
             return img
         except Exception as e:
             logger.error(f"Error loading image from {image_url}: {e}")
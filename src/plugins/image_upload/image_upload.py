@@ -1,14 +1,29 @@
 from plugins.base_plugin.base_plugin import BasePlugin
-from PIL import Image, ImageOps, ImageColor
+from PIL import Image, ImageOps
 import logging
 import random
 import os
 
-from utils.image_utils import pad_image_blur
+from utils.image_cache import file_cache_key, resized_image_cache
+from utils.image_utils import get_background_color, pad_image_blur, pick_resample_filter, prescale_image
 
 logger = logging.getLogger(__name__)
 
 
+def _prefetch_file(path):
+    """Hint the kernel to start reading path into the page cache ahead of the next refresh."""
+    if not hasattr(os, "posix_fadvise"):
+        return
+    try:
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+        finally:
+            os.close(fd)
+    except OSError as e:
+        logger.debug(f"Could not prefetch {path}: {e}")
+
+
 class ImageUpload(BasePlugin):
     def open_image(self, img_index: int, image_locations: list, dimensions: tuple, resize: bool = True) -> Image:
         """
@@ -54,11 +69,7 @@ class ImageUpload(BasePlugin):
             img_index = 0
 
         # Get dimensions
-        dimensions = device_config.get_resolution()
-        orientation = device_config.get_config("orientation")
-        if orientation == "vertical":
-            dimensions = dimensions[::-1]
-            logger.debug(f"Vertical orientation detected, dimensions: {dimensions[0]}x{dimensions[1]}")
+        dimensions = device_config.get_effective_resolution()
 
         # Determine if we need manual padding
         needs_padding = settings.get('padImage') == "true"
@@ -67,29 +78,40 @@ class ImageUpload(BasePlugin):
 
         logger.debug(f"Settings: randomize={is_random}, pad_image={needs_padding}, background_option={background_option}")
 
-        # Load image (without auto-resize if padding needed)
         if is_random:
             img_index = random.randrange(0, len(image_locations))
             logger.info(f"Random mode: Selected image index {img_index}")
-            image = self.open_image(img_index, image_locations, dimensions, resize=not needs_padding)
         else:
             logger.info(f"Sequential mode: Loading image index {img_index}")
+
+        cache_key = file_cache_key(image_locations[img_index], tuple(dimensions), needs_padding and background_option,
+                                   needs_padding and settings.get('backgroundColor'))
+        image = resized_image_cache.get(cache_key) if cache_key else None
+        if image is None:
+            # Load image (without auto-resize if padding needed)
             image = self.open_image(img_index, image_locations, dimensions, resize=not needs_padding)
+
+            # Apply padding if requested
+            if needs_padding:
+                logger.debug(f"Applying padding with {background_option} background")
+                if background_option == "blur":
+                    image = pad_image_blur(image, dimensions)
+                else:
+                    background_color = get_background_color(settings.get('backgroundColor'), image.mode)
+                    image = prescale_image(image, dimensions)
+                    image = ImageOps.pad(image, dimensions, color=background_color, method=pick_resample_filter(image.size, dimensions))
+
+            if cache_key:
+                resized_image_cache.put(cache_key, image)
+
+        if not is_random:
             img_index = (img_index + 1) % len(image_locations)
             logger.debug(f"Next index will be: {img_index}")
+            _prefetch_file(image_locations[img_index])
 
         # Write the new index back to the device json
         settings['image_index'] = img_index
 
-        # Apply padding if requested
-        if needs_padding:
-            logger.debug(f"Applying padding with {background_option} background")
-            if background_option == "blur":
-                image = pad_image_blur(image, dimensions)
-            else:
-                background_color = ImageColor.getcolor(settings.get('backgroundColor') or "white", image.mode)
-                image = ImageOps.pad(image, dimensions, color=background_color, method=Image.Resampling.LANCZOS)
-
         logger.info("=== Image Upload Plugin: Image generation complete ===")
         return image
 
@@ -100,9 +122,10 @@ class ImageUpload(BasePlugin):
             return
 
         for image_path in image_locations:
-            if os.path.exists(image_path):
-                try:
-                    os.remove(image_path)
-                    logger.info(f"Deleted uploaded image: {image_path}")
-                except Exception as e:
-                    logger.warning(f"Failed to delete uploaded image {image_path}: {e}")
+            try:
+                os.remove(image_path)
+                logger.info(f"Deleted uploaded image: {image_path}")
+            except FileNotFoundError:
+                pass
+            except Exception as e:
+                logger.warning(f"Failed to delete uploaded image {image_path}: {e}")
@@ -1,10 +1,11 @@
 from plugins.base_plugin.base_plugin import BasePlugin
+from utils.http_client import get_http_session
 from PIL import Image
 from io import BytesIO
 import feedparser
-import requests
 import logging
 import html
+import time
 
 logger = logging.getLogger(__name__)
 
@@ -16,6 +17,11 @@ FONT_SIZES = {
     "x-large": 1.3
 }
 
+# Parsed feeds by URL; reused outright for a few minutes, then revalidated
+# with the feed's ETag/Last-Modified
+FEED_CACHE_TTL_SECONDS = 300
+_FEED_CACHE = {}
+
 class Rss(BasePlugin):
     def generate_settings_template(self):
         template_params = super().generate_settings_template()
@@ -30,9 +36,7 @@ class Rss(BasePlugin):
         
         items = self.parse_rss_feed(feed_url)
 
-        dimensions = device_config.get_resolution()
-        if device_config.get_config("orientation") == "vertical":
-            dimensions = dimensions[::-1]
+        dimensions = device_config.get_effective_resolution()
 
         template_params = {
             "title": title,
@@ -46,7 +50,21 @@ class Rss(BasePlugin):
         return image
     
     def parse_rss_feed(self, url, timeout=10):
-        resp = requests.get(url, timeout=timeout, headers={"User-Agent": "Mozilla/5.0"})
+        cached = _FEED_CACHE.get(url)
+        if cached and time.monotonic() - cached["fetched_at"] < FEED_CACHE_TTL_SECONDS:
+            return cached["items"]
+
+        headers = {"User-Agent": "Mozilla/5.0"}
+        if cached:
+            if cached["etag"]:
+                headers["If-None-Match"] = cached["etag"]
+            if cached["modified"]:
+                headers["If-Modified-Since"] = cached["modified"]
+
+        resp = get_http_session().get(url, timeout=timeout, headers=headers)
+        if resp.status_code == 304 and cached:
+            cached["fetched_at"] = time.monotonic()
+            return cached["items"]
         resp.raise_for_status()
         
         # Parse the feed content
@@ -72,4 +90,10 @@ class Rss(BasePlugin):
 
             items.append(item)
 
+        _FEED_CACHE[url] = {
+            "etag": resp.headers.get("ETag"),
+            "modified": resp.headers.get("Last-Modified"),
+            "items": items,
+            "fetched_at": time.monotonic()
+        }
         return items
\ No newline at end of file
@@ -12,9 +12,7 @@ class Screenshot(BasePlugin):
         if not url:
             raise RuntimeError("URL is required.")
 
-        dimensions = device_config.get_resolution()
-        if device_config.get_config("orientation") == "vertical":
-            dimensions = dimensions[::-1]
+        dimensions = device_config.get_effective_resolution()
 
         logger.info(f"Taking screenshot of url: {url}")
 
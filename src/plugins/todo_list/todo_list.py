@@ -21,9 +21,7 @@ class TodoList(BasePlugin):
         return template_params
 
     def generate_image(self, settings, device_config):
-        dimensions = device_config.get_resolution()
-        if device_config.get_config("orientation") == "vertical":
-            dimensions = dimensions[::-1]
+        dimensions = device_config.get_effective_resolution()
 
         lists = []
         for title, raw_list in zip(settings['list-title[]'], settings['list[]']):
@@ -1,11 +1,64 @@
 from plugins.base_plugin.base_plugin import BasePlugin
-from utils.image_loader import _is_low_resource_device
+from utils.image_loader import is_low_resource_device
 from utils.http_client import get_http_session
+from utils.image_cache import DiskImageCache
 import logging
+import os
+import requests
 import random
+import time
 
 logger = logging.getLogger(__name__)
 
+# Photo lists by request signature; a random photo is picked from the cached
+# list on each refresh until it expires
+RESULTS_CACHE_TTL_SECONDS = 600
+_RESULTS_CACHE = {}
+
+# Photos requested per call from the random endpoint (the API maximum), so its
+# response can be cached and sampled like search results
+RANDOM_PHOTO_COUNT = 30
+
+# Photos picked per refresh; the second is only downloaded if the first fails
+DOWNLOAD_CANDIDATES = 2
+
+# Unsplash caps search pages at 30 results; later fetches for the same query
+# start from a random one of the first few pages instead of always page 1
+SEARCH_PER_PAGE = 30
+SEARCH_MAX_PAGE = 10
+
+# Processed photos by (url, dimensions), kept across refreshes and restarts;
+# created on first use, and never on low-resource devices
+_image_cache = None
+
+
+def _get_image_cache(device_config, is_low_resource):
+    """
+    Return the on-disk cache of processed photos under the app's cache directory,
+    or None on low-resource devices, where the extra SD card writes aren't worth it.
+    """
+    global _image_cache
+    if is_low_resource:
+        return None
+    if _image_cache is None:
+        _image_cache = DiskImageCache(os.path.join(device_config.cache_dir, "unsplash"))
+    return _image_cache
+
+
+def _photo_url(photo, image_size, dimensions, is_low_resource):
+    """
+    Return a URL for the photo already cropped to the display by Unsplash's image CDN.
+    Falls back to the fixed-size rendition if the photo has no raw URL.
+    """
+    raw_url = photo["urls"].get("raw")
+    if not raw_url:
+        return photo["urls"][image_size]
+
+    width, height = dimensions
+    quality = 75 if is_low_resource else 85
+    separator = "&" if "?" in raw_url else "?"
+    return f"{raw_url}{separator}w={width}&h={height}&fit=crop&q={quality}&fm=jpg"
+
 class Unsplash(BasePlugin):
     def generate_image(self, settings, device_config):
         logger.info("=== Unsplash Plugin: Starting image generation ===")
@@ -22,33 +75,36 @@ class Unsplash(BasePlugin):
         orientation = settings.get('orientation')
 
         # Automatically determine image size based on device capabilities
-        is_low_resource = _is_low_resource_device()
+        is_low_resource = is_low_resource_device()
         image_size = 'regular' if is_low_resource else 'full'
-        logger.info(f"Device type: {'low-resource' if is_low_resource else 'standard'}, using image size: '{image_size}'")
+        logger.info("Device type: %s, using image size: '%s'", 'low-resource' if is_low_resource else 'standard', image_size)
 
-        logger.info(f"Settings: image_size='{image_size}', content_filter='{content_filter}'")
+        logger.info("Settings: image_size='%s', content_filter='%s'", image_size, content_filter)
         if search_query:
-            logger.info(f"Search query: '{search_query}'")
+            logger.info("Search query: '%s'", search_query)
         if collections:
-            logger.info(f"Collections: {collections}")
+            logger.info("Collections: %s", collections)
         if color:
-            logger.debug(f"Color filter: {color}")
+            logger.debug("Color filter: %s", color)
         if orientation:
-            logger.debug(f"Orientation: {orientation}")
+            logger.debug("Orientation: %s", orientation)
+
+        dimensions = device_config.get_effective_resolution()
 
         params = {
             'client_id': access_key,
             'content_filter': content_filter,
-            'per_page': 100,
         }
 
         if search_query:
             url = f"https://api.unsplash.com/search/photos"
             params['query'] = search_query
-            logger.debug(f"Using search endpoint: {url}")
+            params['per_page'] = SEARCH_PER_PAGE
+            logger.debug("Using search endpoint: %s", url)
         else:
             url = f"https://api.unsplash.com/photos/random"
-            logger.debug(f"Using random photo endpoint: {url}")
+            params['count'] = RANDOM_PHOTO_COUNT
+            logger.debug("Using random photo endpoint: %s", url)
 
         if collections:
             params['collections'] = collections
@@ -58,44 +114,53 @@ class Unsplash(BasePlugin):
             params['orientation'] = orientation
 
         try:
-            logger.debug("Fetching image from Unsplash API...")
-            session = get_http_session()
-            response = session.get(url, params=params)
-            response.raise_for_status()
-            data = response.json()
-
-            if search_query:
-                results = data.get("results")
-                if not results:
-                    logger.warning(f"No images found for search query: '{search_query}'")
-                    raise RuntimeError("No images found for the given search query.")
-                logger.info(f"Found {len(results)} images matching search query")
-                # Use selected image size (with automatic downgrade for low-RAM devices)
-                selected_photo = random.choice(results)
-                image_url = selected_photo["urls"][image_size]
-                logger.debug(f"Selected random image from {len(results)} results")
+            cache_key = (url, access_key, search_query, collections, color, orientation, content_filter)
+            cached = _RESULTS_CACHE.get(cache_key)
+            if cached and time.monotonic() - cached["fetched_at"] < RESULTS_CACHE_TTL_SECONDS:
+                logger.debug("Using cached Unsplash API response")
+                results = cached["results"]
             else:
-                # Use selected image size (with automatic downgrade for low-RAM devices)
-                image_url = data["urls"][image_size]
-                logger.debug("Retrieved random image URL")
+                # The page count is only known once the query has been fetched
+                if search_query and cached:
+                    params['page'] = random.randint(1, min(cached["total_pages"], SEARCH_MAX_PAGE))
+                logger.debug("Fetching image from Unsplash API...")
+                session = get_http_session()
+                response = session.get(url, params=params, timeout=10)
+                response.raise_for_status()
+                data = response.json()
+
+                # The random endpoint returns a list when a count is requested
+                results = data.get("results") if search_query else data
+                if not results:
+                    if search_query:
+                        logger.warning("No images found for search query: '%s'", search_query)
+                        raise RuntimeError("No images found for the given search query.")
+                    raise RuntimeError("Unsplash returned no images.")
+                _RESULTS_CACHE[cache_key] = {
+                    "results": results,
+                    "total_pages": data.get("total_pages", 1) if search_query else 1,
+                    "fetched_at": time.monotonic()
+                }
+
+            logger.info("Found %d candidate images", len(results))
+            # Have the CDN crop to the display; the selected image size (with automatic
+            # downgrade for low-RAM devices) is only the fallback
+            selected_photos = random.sample(results, min(DOWNLOAD_CANDIDATES, len(results)))
+            image_urls = [_photo_url(photo, image_size, dimensions, is_low_resource) for photo in selected_photos]
+            logger.debug("Selected %d random images from %d results", len(image_urls), len(results))
 
         except requests.exceptions.RequestException as e:
-            logger.error(f"Error fetching image from Unsplash API: {e}")
+            logger.error("Error fetching image from Unsplash API: %s", e)
             raise RuntimeError("Failed to fetch image from Unsplash API, please check logs.")
         except (KeyError, IndexError) as e:
-            logger.error(f"Error parsing Unsplash API response: {e}")
+            logger.error("Error parsing Unsplash API response: %s", e)
             raise RuntimeError("Failed to parse Unsplash API response, please check logs.")
 
-
-        dimensions = device_config.get_resolution()
-        if device_config.get_config("orientation") == "vertical":
-            dimensions = dimensions[::-1]
-            logger.debug(f"Vertical orientation detected, dimensions: {dimensions[0]}x{dimensions[1]}")
-
-        logger.info(f"Fetching image (size: {image_size}): {image_url}")
+        logger.info("Fetching image: %s", image_urls[0])
 
         # Use adaptive image loader for memory-efficient processing
-        image = self.image_loader.from_url(image_url, dimensions, timeout_ms=40000)
+        image_cache = _get_image_cache(device_config, is_low_resource)
+        image = self.load_first_image(image_urls, dimensions, image_cache)
 
         if not image:
             logger.error("Failed to load and process image")
@@ -103,3 +168,30 @@ class Unsplash(BasePlugin):
 
         logger.info("=== Unsplash Plugin: Image generation complete ===")
         return image
+
+    def load_first_image(self, image_urls, dimensions, image_cache=None):
+        """
+        Return the first candidate image that loads, or None if none do.
+        A candidate already in the disk cache is returned without downloading;
+        otherwise the candidates are downloaded one at a time, so a failed
+        download falls back to the next without holding two images in memory.
+        """
+        if image_cache:
+            for image_url in image_urls:
+                image = image_cache.get((image_url, tuple(dimensions)))
+                if image:
+                    return image
+
+        for image_url in image_urls:
+            image = self.load_image(image_url, dimensions, image_cache)
+            if image:
+                return image
+            logger.warning("Failed to load %s, trying next candidate", image_url)
+        return None
+
+    def load_image(self, image_url, dimensions, image_cache=None):
+        """Download and process one photo, saving the result to the disk cache if there is one."""
+        image = self.image_loader.from_url(image_url, dimensions, timeout_ms=40000)
+        if image and image_cache:
+            image_cache.put((image_url, tuple(dimensions)), image)
+        return image
@@ -55,12 +55,8 @@ class Wpotd(BasePlugin):
         logger.debug(f"Image filename: {data.get('filename', 'Unknown')}")
 
         # Get dimensions
-        max_width, max_height = device_config.get_resolution()
-        if device_config.get_config("orientation") == "vertical":
-            max_width, max_height = max_height, max_width
-            logger.debug(f"Vertical orientation detected, dimensions: {max_width}x{max_height}")
-
-        dimensions = (max_width, max_height)
+        dimensions = device_config.get_effective_resolution()
+        max_width, max_height = dimensions
 
         # Use adaptive loader if shrink-to-fit is enabled
         shrink_to_fit = settings.get("shrinkToFitWpotd") == "true"
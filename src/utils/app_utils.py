@@ -3,6 +3,7 @@ import os
 import socket
 import subprocess
 
+from functools import lru_cache
 from pathlib import Path
 from PIL import Image, ImageDraw, ImageFont, ImageOps
 
@@ -71,6 +72,8 @@ def is_connected():
     except OSError:
         return False
 
+# Font faces are immutable once loaded, so reuse them instead of re-reading the TTF each render
+@lru_cache(maxsize=32)
 def get_font(font_name, font_size=50, font_weight="normal"):
     if font_name in FONT_FAMILIES:
         font_variants = FONT_FAMILIES[font_name]
@@ -18,6 +18,7 @@ Usage:
 import requests
 import logging
 from typing import Optional
+from urllib3.util.retry import Retry
 
 logger = logging.getLogger(__name__)
 
@@ -46,10 +47,18 @@ def get_http_session() -> requests.Session:
 
         # Configure connection pool
         # Max 10 connections per host (reasonable for e-ink device)
+        # Retry connection errors and transient gateway errors with a short backoff;
+        # final error responses are returned to the caller rather than raised
+        retries = Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=(502, 503, 504),
+            raise_on_status=False
+        )
         adapter = requests.adapters.HTTPAdapter(
             pool_connections=10,
             pool_maxsize=10,
-            max_retries=3,
+            max_retries=retries,
             pool_block=False
         )
         _HTTP_SESSION.mount('http://', adapter)
@@ -0,0 +1,150 @@
+"""
+Caches of display-ready images.
+
+Image Folder and Image Upload rotate through the same handful of files, so the
+decode + resize/pad result is kept in a process-wide LRU keyed by the file's
+path and mtime plus the settings that shaped it. Editing or replacing a file
+changes its mtime and naturally misses the cache.
+
+Remote images are kept in a size-bounded on-disk LRU instead, so a photo picked
+again (or re-rendered after a restart) skips the download and resize.
+"""
+
+from collections import OrderedDict
+from PIL import Image
+from utils.image_loader import is_low_resource_device
+import hashlib
+import logging
+import os
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+
+class ResizedImageCache:
+    """
+    LRU mapping a key to a processed PIL image, bounded by entry count and by
+    the total size of the decoded pixel data; callers always get a copy.
+    """
+
+    def __init__(self, max_entries=16, max_bytes=32 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+        logger.debug(f"Resized image cache hit: {key[0]}")
+        return entry[0].copy()
+
+    def put(self, key, img):
+        size = img.width * img.height * len(img.getbands())
+        if self.max_entries <= 0 or size > self.max_bytes:
+            return
+
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._total_bytes -= old[1]
+            self._entries[key] = (img.copy(), size)
+            self._total_bytes += size
+            while len(self._entries) > self.max_entries or self._total_bytes > self.max_bytes:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self._total_bytes -= evicted_size
+
+
+def new_resized_image_cache(low_resource):
+    """Create a ResizedImageCache sized for the device; low-RAM devices keep only the last couple of frames."""
+    if low_resource:
+        return ResizedImageCache(max_entries=2, max_bytes=6 * 1024 * 1024)
+    return ResizedImageCache()
+
+
+resized_image_cache = new_resized_image_cache(is_low_resource_device())
+
+
+def file_cache_key(path, *params):
+    """Build a cache key for path from its mtime and the processing params, or None if it can't be stat'ed."""
+    try:
+        mtime_ns = os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+    return (path, mtime_ns) + params
+
+
+class DiskImageCache:
+    """
+    Size-bounded on-disk LRU of processed images, stored as PNG files.
+    Reads refresh a file's mtime; the least recently used files are evicted
+    once the directory grows past max_bytes. Failures are logged and treated
+    as cache misses.
+    """
+
+    def __init__(self, directory, max_bytes=64 * 1024 * 1024, ttl_seconds=86400):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+
+    def _path(self, key):
+        digest = hashlib.sha1(repr(key).encode("utf-8")).hexdigest()
+        return os.path.join(self.directory, f"{digest}.png")
+
+    def get(self, key):
+        path = self._path(key)
+        try:
+            if time.time() - os.stat(path).st_mtime > self.ttl_seconds:
+                os.remove(path)
+                return None
+            img = Image.open(path)
+            img.load()
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Could not read cached image {path}: {e}")
+            return None
+        logger.debug(f"Disk image cache hit: {path}")
+        return img
+
+    def put(self, key, img):
+        path = self._path(key)
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            # Light compression keeps the encode cheap on a Pi
+            img.save(tmp_path, format="PNG", compress_level=1)
+            os.replace(tmp_path, path)
+            self._evict()
+        except Exception as e:
+            logger.warning(f"Could not write cached image {path}: {e}")
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+
+    def _evict(self):
+        with self._lock:
+            entries = []
+            with os.scandir(self.directory) as it:
+                for entry in it:
+                    if entry.name.endswith(".png"):
+                        stat = entry.stat()
+                        entries.append((stat.st_mtime, stat.st_size, entry.path))
+
+            total = sum(size for _, size, _ in entries)
+            for _, size, path in sorted(entries):
+                if total <= self.max_bytes:
+                    break
+                try:
+                    os.remove(path)
+                    total -= size
+                except FileNotFoundError:
+                    pass
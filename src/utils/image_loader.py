@@ -6,10 +6,11 @@ Automatically uses memory-efficient strategies on low-RAM devices (Pi Zero)
 and high-performance strategies on capable devices (Pi 3/4).
 """
 
-from PIL import Image, ImageOps
-from io import BytesIO
+from PIL import ExifTags, Image, ImageOps, UnidentifiedImageError
 from utils.http_client import get_http_session
+from functools import lru_cache
 import logging
+import requests
 import gc
 import psutil
 import tempfile
@@ -17,11 +18,16 @@ import os
 
 logger = logging.getLogger(__name__)
 
+# Downloads larger than this are buffered in a temp file rather than in memory
+SPOOL_MAX_BYTES = 4 * 1024 * 1024
 
-def _is_low_resource_device():
+
+@lru_cache(maxsize=1)
+def is_low_resource_device():
     """
     Detect if running on a low-resource device (e.g., Raspberry Pi Zero).
     Returns True if device has less than 1GB RAM, False otherwise.
+    Total RAM doesn't change while running, so the result is computed once.
     """
     try:
         total_memory_gb = psutil.virtual_memory().total / (1024 ** 3)
@@ -34,6 +40,89 @@ def _is_low_resource_device():
         return True
 
 
+_HEIF_EXTENSIONS = ('.heif', '.heic')
+_heif_registered = False
+
+
+def ensure_heif_opener():
+    """
+    Register the HEIF/HEIC opener with Pillow on first use.
+    Deferred so libheif is only loaded once a HEIF image is actually encountered.
+    """
+    global _heif_registered
+    if not _heif_registered:
+        from pi_heif import register_heif_opener
+        register_heif_opener()
+        _heif_registered = True
+        logger.debug("Registered HEIF/HEIC image opener")
+
+
+def _open_image(source):
+    """
+    Image.open() that registers the HEIF opener on demand.
+    File paths with a HEIF extension register up front; other sources (e.g. downloads)
+    are retried once with the opener registered if Pillow cannot identify them.
+    """
+    if isinstance(source, str) and source.lower().endswith(_HEIF_EXTENSIONS):
+        ensure_heif_opener()
+
+    try:
+        return Image.open(source)
+    except UnidentifiedImageError:
+        if _heif_registered:
+            raise
+        ensure_heif_opener()
+        if hasattr(source, 'seek'):
+            source.seek(0)
+        return Image.open(source)
+
+
+# EXIF orientations that rotate the image by 90 degrees, swapping width and height
+_ROTATED_ORIENTATIONS = (5, 6, 7, 8)
+
+# EXIF orientation -> transpose that makes the image upright (as in ImageOps.exif_transpose)
+_ORIENTATION_TRANSPOSE = {
+    2: Image.Transpose.FLIP_LEFT_RIGHT,
+    3: Image.Transpose.ROTATE_180,
+    4: Image.Transpose.FLIP_TOP_BOTTOM,
+    5: Image.Transpose.TRANSPOSE,
+    6: Image.Transpose.ROTATE_270,
+    7: Image.Transpose.TRANSVERSE,
+    8: Image.Transpose.ROTATE_90,
+}
+
+
+def _draft_for_target(img, dimensions):
+    """
+    Ask the JPEG decoder to downscale in the DCT while keeping at least 2x the target size.
+    Must be called before the pixel data is loaded; a no-op for other formats.
+    """
+    if img.format != 'JPEG':
+        return
+
+    width, height = dimensions
+    # Draft applies to the stored orientation, before exif_transpose rotates it
+    if img.getexif().get(ExifTags.Base.Orientation) in _ROTATED_ORIENTATIONS:
+        width, height = height, width
+
+    if img.draft('RGB', (width * 2, height * 2)):
+        logger.debug(f"Draft mode applied - decoding at {img.size[0]}x{img.size[1]}")
+
+
+def _load_upright(img):
+    """
+    Decode the pixel data once and apply any EXIF orientation.
+    Unrotated images are returned as-is; exif_transpose would otherwise copy them.
+    """
+    # Load first: the TIFF decoder applies the orientation itself while loading
+    # and drops the tag, so reading it beforehand would rotate the image twice
+    img.load()
+    orientation = img.getexif().get(ExifTags.Base.Orientation, 1)
+    if orientation != 1:
+        return ImageOps.exif_transpose(img)
+    return img
+
+
 class AdaptiveImageLoader:
     """
     Centralized image loading with device-adaptive optimizations.
@@ -58,7 +147,7 @@ class AdaptiveImageLoader:
     }
 
     def __init__(self):
-        self.is_low_resource = _is_low_resource_device()
+        self.is_low_resource = is_low_resource_device()
 
     def from_url(self, url, dimensions, timeout_ms=40000, resize=True, headers=None):
         """
@@ -123,7 +212,7 @@ class AdaptiveImageLoader:
         logger.debug("Loading image from BytesIO")
 
         try:
-            img = Image.open(data)
+            img = _open_image(data)
             original_size = img.size
             original_pixels = original_size[0] * original_size[1]
             logger.info(f"Loaded image: {original_size[0]}x{original_size[1]} ({img.mode} mode, {original_pixels/1_000_000:.1f}MP)")
@@ -131,8 +220,11 @@ class AdaptiveImageLoader:
             if resize:
                 img = self._process_and_resize(img, dimensions, original_size)
             else:
+                # Callers scale the result to the display themselves, so a reduced
+                # decode still leaves them enough resolution
+                _draft_for_target(img, dimensions)
                 # Even without resizing, apply EXIF orientation correction
-                img = ImageOps.exif_transpose(img)
+                img = _load_upright(img)
                 if img.size != original_size:
                     logger.debug(f"EXIF orientation applied: {original_size[0]}x{original_size[1]} -> {img.size[0]}x{img.size[1]}")
 
@@ -180,25 +272,26 @@ class AdaptiveImageLoader:
             return None
         finally:
             # Clean up temp file
-            if tmp_path and os.path.exists(tmp_path):
+            if tmp_path:
                 try:
                     os.unlink(tmp_path)
                     logger.debug(f"Cleaned up temp file: {tmp_path}")
+                except FileNotFoundError:
+                    pass
                 except Exception as e:
                     logger.warning(f"Could not delete temp file {tmp_path}: {e}")
 
     def _load_from_file_lowmem(self, path, dimensions, resize):
         """Low-memory file loading using draft mode."""
         try:
-            img = Image.open(path)
+            img = _open_image(path)
             original_size = img.size
             original_pixels = original_size[0] * original_size[1]
             logger.info(f"Loaded image: {original_size[0]}x{original_size[1]} ({img.mode} mode, {original_pixels/1_000_000:.1f}MP)")
 
             if resize:
                 # Apply draft mode for massive memory savings during decode
-                img.draft('RGB', (dimensions[0] * 2, dimensions[1] * 2))
-                logger.debug(f"Draft mode applied - PIL will decode at reduced resolution")
+                _draft_for_target(img, dimensions)
 
                 # Force load with draft mode
                 img.load()
@@ -206,8 +299,11 @@ class AdaptiveImageLoader:
 
                 img = self._process_and_resize(img, dimensions, original_size)
             else:
+                # Callers scale the result to the display themselves, so a reduced
+                # decode still leaves them enough resolution
+                _draft_for_target(img, dimensions)
                 # Even without resizing, apply EXIF orientation correction
-                img = ImageOps.exif_transpose(img)
+                img = _load_upright(img)
                 if img.size != original_size:
                     logger.debug(f"EXIF orientation applied: {original_size[0]}x{original_size[1]} -> {img.size[0]}x{img.size[1]}")
 
@@ -236,18 +332,29 @@ class AdaptiveImageLoader:
             response = session.get(url, timeout=timeout_ms / 1000, stream=True, headers=request_headers)
             response.raise_for_status()
 
-            img = Image.open(BytesIO(response.content))
-            original_size = img.size
-            original_pixels = original_size[0] * original_size[1]
-            logger.info(f"Downloaded image: {original_size[0]}x{original_size[1]} ({img.mode} mode, {original_pixels/1_000_000:.1f}MP)")
-
-            if resize:
-                img = self._process_and_resize(img, dimensions, original_size)
-            else:
-                # Even without resizing, apply EXIF orientation correction
-                img = ImageOps.exif_transpose(img)
-                if img.size != original_size:
-                    logger.debug(f"EXIF orientation applied: {original_size[0]}x{original_size[1]} -> {img.size[0]}x{img.size[1]}")
+            # Small images stay in memory; unusually large downloads spill to disk
+            # instead of being held in RAM twice (raw bytes plus decoded pixels)
+            with tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_BYTES) as buf:
+                for chunk in response.iter_content(chunk_size=64 * 1024):
+                    buf.write(chunk)
+                buf.seek(0)
+
+                img = _open_image(buf)
+                original_size = img.size
+                original_pixels = original_size[0] * original_size[1]
+                logger.info(f"Downloaded image: {original_size[0]}x{original_size[1]} ({img.mode} mode, {original_pixels/1_000_000:.1f}MP)")
+
+                # Both branches load the pixel data before the buffer is closed
+                if resize:
+                    img = self._process_and_resize(img, dimensions, original_size)
+                else:
+                    # Callers scale the result to the display themselves, so a reduced
+                    # decode still leaves them enough resolution
+                    _draft_for_target(img, dimensions)
+                    # Even without resizing, apply EXIF orientation correction
+                    img = _load_upright(img)
+                    if img.size != original_size:
+                        logger.debug(f"EXIF orientation applied: {original_size[0]}x{original_size[1]} -> {img.size[0]}x{img.size[1]}")
 
             return img
 
@@ -261,7 +368,7 @@ class AdaptiveImageLoader:
     def _load_from_file_fast(self, path, dimensions, resize):
         """High-performance file loading using in-memory processing."""
         try:
-            img = Image.open(path)
+            img = _open_image(path)
             original_size = img.size
             original_pixels = original_size[0] * original_size[1]
             logger.info(f"Loaded image: {original_size[0]}x{original_size[1]} ({img.mode} mode, {original_pixels/1_000_000:.1f}MP)")
@@ -269,8 +376,11 @@ class AdaptiveImageLoader:
             if resize:
                 img = self._process_and_resize(img, dimensions, original_size)
             else:
+                # Callers scale the result to the display themselves, so a reduced
+                # decode still leaves them enough resolution
+                _draft_for_target(img, dimensions)
                 # Even without resizing, apply EXIF orientation correction
-                img = ImageOps.exif_transpose(img)
+                img = _load_upright(img)
                 if img.size != original_size:
                     logger.debug(f"EXIF orientation applied: {original_size[0]}x{original_size[1]} -> {img.size[0]}x{img.size[1]}")
 
@@ -294,13 +404,23 @@ class AdaptiveImageLoader:
         Returns:
             Processed and resized PIL Image
         """
-        # Apply EXIF orientation correction first (before any processing)
-        # This handles images from cameras/phones that store rotation in EXIF metadata
-        # Safe to call on any image - returns unchanged if no EXIF data present
-        img = ImageOps.exif_transpose(img)
-        if img.size != original_size:
-            logger.debug(f"EXIF orientation applied: {original_size[0]}x{original_size[1]} -> {img.size[0]}x{img.size[1]}")
-        
+        # Let JPEGs decode at a reduced DCT scale before any pixel access; a no-op
+        # if the image was already loaded
+        _draft_for_target(img, dimensions)
+
+        # The TIFF decoder applies the orientation itself while loading and drops the
+        # tag, so only read it once the (possibly drafted) pixel data is loaded
+        img.load()
+
+        # Read the EXIF orientation (set by cameras/phones that store rotation in metadata)
+        # before resizing, but apply it after downscaling so the transpose only touches the
+        # small output. Rotated images are resized to the swapped target so they land on
+        # `dimensions` once transposed.
+        orientation = img.getexif().get(ExifTags.Base.Orientation, 1)
+        target = dimensions
+        if orientation in _ROTATED_ORIENTATIONS:
+            target = (dimensions[1], dimensions[0])
+
         # Convert to RGB if necessary (removes alpha channel, saves memory)
         # E-ink displays don't need alpha channel anyway
         if img.mode in ('RGBA', 'LA', 'P'):
@@ -309,9 +429,21 @@ class AdaptiveImageLoader:
 
         # Choose processing strategy based on device capabilities
         if self.is_low_resource:
-            img = self._resize_low_resource(img, dimensions)
+            img = self._resize_low_resource(img, target)
         else:
-            img = self._resize_high_performance(img, dimensions)
+            img = self._resize_high_performance(img, target)
+
+        transpose = _ORIENTATION_TRANSPOSE.get(orientation)
+        if transpose is not None:
+            # Transpose explicitly: not every format's EXIF survives the resize (TIFF keeps
+            # it in tag_v2, which resized copies drop), so exif_transpose can't be relied on
+            img = img.transpose(transpose)
+            exif = img.getexif()
+            if ExifTags.Base.Orientation in exif:
+                # Mark the pixels as upright so nothing downstream rotates them again
+                del exif[ExifTags.Base.Orientation]
+                img.info["exif"] = exif.tobytes()
+            logger.debug(f"EXIF orientation {orientation} applied after resize: {original_size[0]}x{original_size[1]} -> {img.size[0]}x{img.size[1]}")
 
         logger.info(f"Image processing complete: {dimensions[0]}x{dimensions[1]}")
         return img
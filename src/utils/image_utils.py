@@ -1,5 +1,4 @@
-import requests
-from PIL import Image, ImageEnhance, ImageOps, ImageFilter
+from PIL import Image, ImageColor, ImageEnhance, ImageOps, ImageFilter
 from io import BytesIO
 import os
 import logging
@@ -8,10 +7,13 @@ import tempfile
 import subprocess
 import shutil
 
+from functools import lru_cache
+from utils.http_client import get_http_session
+
 logger = logging.getLogger(__name__)
 
 def get_image(image_url):
-    response = requests.get(image_url, timeout=30)
+    response = get_http_session().get(image_url, timeout=30)
     img = None
     if 200 <= response.status_code < 300 or response.status_code == 304:
         img = Image.open(BytesIO(response.content))
@@ -61,6 +63,29 @@ def resize_image(image, desired_size, image_settings=[]):
     # Step 3: Resize to the exact desired dimensions (if necessary)
     return image.resize((desired_width, desired_height), Image.LANCZOS)
 
+@lru_cache(maxsize=64)
+def get_background_color(color, mode):
+    """Parse a padding background colour setting for an image mode, defaulting to white."""
+    return ImageColor.getcolor(color or "white", mode)
+
+def pick_resample_filter(image_size, desired_size):
+    """Use LANCZOS only for heavy (<= 0.5x) downscales; BICUBIC is indistinguishable closer to 1:1."""
+    scale = min(desired_size[0] / image_size[0], desired_size[1] / image_size[1])
+    return Image.LANCZOS if scale <= 0.5 else Image.BICUBIC
+
+# Modes Image.reduce() supports
+_REDUCIBLE_MODES = ("L", "LA", "RGB", "RGBA", "CMYK", "YCbCr", "I", "F")
+
+def prescale_image(img, desired_size):
+    """
+    Box-reduce by an integer factor while keeping at least 2x the desired size in both
+    dimensions, so a following LANCZOS fit/pad filters far fewer source pixels.
+    """
+    factor = int(min(img.width / desired_size[0], img.height / desired_size[1]) // 2)
+    if factor > 1 and img.mode in _REDUCIBLE_MODES:
+        return img.reduce(factor)
+    return img
+
 def apply_image_enhancement(img, image_settings={}):
     # Convert image to RGB mode if necessary for enhancement operations
     # ImageEnhance requires RGB mode for operations like blend
@@ -173,6 +198,7 @@ def take_screenshot(target, dimensions, timeout_ms=None):
     return image
 
 def pad_image_blur(img: Image, dimensions: tuple[int, int]) -> Image:
+    img = prescale_image(img, dimensions)
     bkg = ImageOps.fit(img, dimensions)
     bkg = bkg.filter(ImageFilter.BoxBlur(8))
     img = ImageOps.contain(img, dimensions)
@@ -0,0 +1,8 @@
+import os
+import sys
+
+# Modules under src/ import each other as top-level packages (utils, plugins, ...),
+# as they do when the app runs from src/
+SRC_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+if SRC_DIR not in sys.path:
+    sys.path.insert(0, SRC_DIR)
@@ -0,0 +1,56 @@
+import pytest
+from dotenv import dotenv_values
+
+from src.blueprints.apikeys import parse_env_file, write_env_file
+
+class TestEnvParser:
+
+    @pytest.mark.parametrize(
+        "line",
+        [
+            # --- Unquoted ---
+            "KEY=secret",
+            "KEY = secret ",
+            "KEY=secret # note",
+            "KEY=sec#ret",
+            "KEY=#secret",
+            "KEY= # note",
+            "KEY=",
+
+            # --- Quoted ---
+            'KEY="secret"',
+            "KEY='secret'",
+            'KEY="sec ret"',
+            'KEY="secret" # note',
+            "KEY='secret' # note",
+            'KEY="sec # ret"',
+
+            # --- export prefix ---
+            "export KEY=secret",
+            'export KEY="secret" # note',
+
+            # --- Escapes ---
+            r'KEY="sec\"ret"',
+            r'KEY="sec\\ret"',
+            r'KEY="sec\\"',
+            r"KEY='sec\'ret'",
+            r"KEY='sec\\ret'",
+            r"KEY=sec\ret",
+        ]
+    )
+    def test_matches_dotenv(self, tmp_path, line):
+        env_file = tmp_path / ".env"
+        env_file.write_text(f"# comment\n{line}\n", encoding="utf-8")
+
+        assert dict(parse_env_file(str(env_file))) == dotenv_values(env_file)
+
+    @pytest.mark.parametrize(
+        "value",
+        ["secret", "sec ret", 'sec"ret', "sec'ret", "sec\\ret", 'sec\\"ret', "sec #ret", "sec\t#ret", "#secret"]
+    )
+    def test_write_round_trip(self, tmp_path, value):
+        env_file = tmp_path / ".env"
+        assert write_env_file(str(env_file), [("KEY", value)])
+
+        assert parse_env_file(str(env_file)) == [("KEY", value)]
+        assert dotenv_values(env_file) == {"KEY": value}
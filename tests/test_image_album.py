@@ -0,0 +1,110 @@
+import threading
+import time
+from unittest import mock
+
+import pytest
+import requests
+
+import plugins.image_album.image_album as image_album
+from plugins.image_album.image_album import ImmichProvider
+
+PAGE_SIZE = 3
+
+
+def make_provider(pages, delays=None, fail_page=None, report_next_page=True):
+    """
+    ImmichProvider with a mocked session serving `pages` (page number -> item count).
+    Pages not listed are empty; `delays` holds per-page response delays in seconds.
+    """
+    requested = []
+    lock = threading.Lock()
+
+    def post(url, json, headers):
+        page = json["page"]
+        with lock:
+            requested.append(page)
+        time.sleep((delays or {}).get(page, 0))
+
+        response = mock.Mock()
+        if page == fail_page:
+            response.raise_for_status.side_effect = requests.exceptions.HTTPError("500 Server Error")
+            return response
+
+        items = [{"id": f"{page}-{i}", "originalFileName": "x.jpg"} for i in range(pages.get(page, 0))]
+        assets = {"items": items}
+        if report_next_page:
+            assets["nextPage"] = str(page + 1) if page + 1 in pages else None
+        response.json.return_value = {"assets": assets}
+        return response
+
+    provider = ImmichProvider("http://immich", "key", image_loader=mock.Mock())
+    provider.session = mock.Mock()
+    provider.session.post.side_effect = post
+    return provider, requested
+
+
+def ids(count_by_page):
+    return [f"{page}-{i}" for page, n in count_by_page for i in range(n)]
+
+
+class TestImmichAssetPaging:
+
+    @pytest.fixture(autouse=True)
+    def small_pages(self, monkeypatch):
+        monkeypatch.setattr(image_album, "ASSET_PAGE_SIZE", PAGE_SIZE)
+        image_album._ALBUM_CACHE.clear()
+        yield
+        image_album._ALBUM_CACHE.clear()
+
+    def test_single_page(self):
+        provider, requested = make_provider({1: 2})
+
+        assert provider.get_assets("album") == [{"id": "1-0"}, {"id": "1-1"}]
+        assert requested == [1]
+
+    def test_pages_arriving_out_of_order_keep_page_order(self):
+        pages = {1: 3, 2: 3, 3: 3, 4: 3, 5: 3, 6: 1}
+        # Earlier pages answer slowest, so later pages complete first
+        delays = {2: 0.15, 3: 0.1, 4: 0.05}
+        provider, requested = make_provider(pages, delays)
+
+        assets = provider.get_assets("album")
+
+        assert [a["id"] for a in assets] == ids(sorted(pages.items()))
+        assert set(requested) >= set(pages)
+
+    def test_stops_at_last_page_reported_by_server(self):
+        pages = {1: 3, 2: 3, 3: 1}
+        provider, requested = make_provider(pages)
+
+        assets = provider.get_assets("album")
+
+        assert [a["id"] for a in assets] == ids(sorted(pages.items()))
+        # The window is topped up until page 3 reports no next page, so at most
+        # ASSET_PAGE_WORKERS - 1 pages past the end are ever requested
+        assert max(requested) <= 3 + image_album.ASSET_PAGE_WORKERS - 1
+
+    def test_stops_at_empty_page_without_next_page(self):
+        pages = {1: 3, 2: 3, 3: 1}
+        provider, requested = make_provider(pages, report_next_page=False)
+
+        assets = provider.get_assets("album")
+
+        assert [a["id"] for a in assets] == ids(sorted(pages.items()))
+        # Here the empty page 4 is what ends the album
+        assert 4 in requested
+        assert max(requested) <= 4 + image_album.ASSET_PAGE_WORKERS - 1
+
+    def test_error_on_one_page_propagates(self):
+        provider, _ = make_provider({1: 3, 2: 3, 3: 3, 4: 1}, fail_page=3)
+
+        with pytest.raises(requests.exceptions.HTTPError):
+            provider.get_assets("album")
+
+    def test_error_on_one_page_is_not_cached(self):
+        provider, _ = make_provider({1: 3, 2: 3, 3: 3, 4: 1}, fail_page=3)
+        provider.get_album_id = mock.Mock(return_value="album-id")
+
+        assert provider.get_image("Album", (800, 480)) is None
+        assert image_album._ALBUM_CACHE == {}
+        provider.image_loader.from_url.assert_not_called()
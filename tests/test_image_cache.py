@@ -0,0 +1,156 @@
+import os
+import time
+
+import pytest
+from PIL import Image
+
+import plugins.image_folder.image_folder as image_folder
+from utils.image_cache import DiskImageCache, ResizedImageCache, new_resized_image_cache
+
+FRAME_BYTES = 100 * 50 * 3
+
+
+def frame(color="white"):
+    return Image.new("RGB", (100, 50), color)
+
+
+class TestResizedImageCache:
+
+    def test_evicts_least_recently_used_past_byte_budget(self):
+        cache = ResizedImageCache(max_entries=16, max_bytes=FRAME_BYTES * 2)
+        cache.put("a", frame())
+        cache.put("b", frame())
+        cache.get("a")  # "b" is now the least recently used
+        cache.put("c", frame())
+
+        assert cache.get("a") is not None
+        assert cache.get("b") is None
+        assert cache.get("c") is not None
+
+    def test_evicts_past_entry_count(self):
+        cache = ResizedImageCache(max_entries=2, max_bytes=FRAME_BYTES * 10)
+        for key in ("a", "b", "c"):
+            cache.put(key, frame())
+
+        assert cache.get("a") is None
+        assert cache.get("b") is not None and cache.get("c") is not None
+
+    def test_skips_image_larger_than_budget(self):
+        cache = ResizedImageCache(max_entries=16, max_bytes=FRAME_BYTES - 1)
+        cache.put("a", frame())
+
+        assert cache.get("a") is None
+
+    def test_replacing_a_key_does_not_double_count(self):
+        cache = ResizedImageCache(max_entries=16, max_bytes=FRAME_BYTES * 2)
+        cache.put("a", frame())
+        cache.put("a", frame("red"))
+        cache.put("b", frame())
+
+        assert cache.get("a").getpixel((0, 0)) == (255, 0, 0)
+        assert cache.get("b") is not None
+
+    def test_returns_copies(self):
+        cache = ResizedImageCache()
+        cache.put("a", frame())
+        cache.get("a").paste((255, 0, 0), (0, 0, 100, 50))
+
+        assert cache.get("a").getpixel((0, 0)) == (255, 255, 255)
+
+    @pytest.mark.parametrize(
+        "low_resource,max_entries,max_bytes",
+        [
+            (True, 2, 6 * 1024 * 1024),
+            (False, 16, 32 * 1024 * 1024),
+        ]
+    )
+    def test_device_limits(self, low_resource, max_entries, max_bytes):
+        cache = new_resized_image_cache(low_resource)
+
+        assert cache.max_entries == max_entries
+        assert cache.max_bytes == max_bytes
+
+
+class TestFolderCache:
+
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        image_folder._FOLDER_CACHE.clear()
+        yield
+        image_folder._FOLDER_CACHE.clear()
+
+    def test_hit_then_invalidated_by_subdirectory_change(self, tmp_path, monkeypatch):
+        subdir = tmp_path / "sub"
+        subdir.mkdir()
+        (tmp_path / "a.jpg").touch()
+        (subdir / "b.png").touch()
+        (subdir / "notes.txt").touch()
+        (subdir / ".hidden.jpg").touch()
+
+        files = image_folder.list_files_in_folder(str(tmp_path))
+        assert sorted(files) == sorted([str(tmp_path / "a.jpg"), str(subdir / "b.png")])
+
+        # Unchanged directories are served from the cache without rescanning
+        real_scandir = os.scandir
+        scans = []
+        monkeypatch.setattr(image_folder.os, "scandir", lambda path: scans.append(path) or real_scandir(path))
+        assert image_folder.list_files_in_folder(str(tmp_path)) == files
+        assert scans == []
+
+        # A new file only changes the subdirectory's mtime, which still invalidates the listing
+        (subdir / "c.webp").touch()
+        st = os.stat(subdir)
+        os.utime(subdir, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+        files = image_folder.list_files_in_folder(str(tmp_path))
+        assert str(subdir / "c.webp") in files
+        assert scans
+
+
+class TestDiskImageCache:
+
+    def set_age(self, cache, key, seconds):
+        path = cache._path(key)
+        then = time.time() - seconds
+        os.utime(path, (then, then))
+
+    def test_round_trip(self, tmp_path):
+        cache = DiskImageCache(str(tmp_path / "cache"))
+        cache.put(("url", (100, 50)), frame("red"))
+
+        img = cache.get(("url", (100, 50)))
+        assert img.size == (100, 50)
+        assert img.getpixel((0, 0)) == (255, 0, 0)
+        assert cache.get(("url", (200, 100))) is None
+
+    def test_evicts_least_recently_read_past_byte_budget(self, tmp_path):
+        cache = DiskImageCache(str(tmp_path))
+        cache.put("a", frame())
+        cache.put("b", frame())
+        self.set_age(cache, "a", 100)
+        self.set_age(cache, "b", 50)
+        cache.get("a")  # reading refreshes "a", leaving "b" the least recently used
+
+        cache.max_bytes = 2 * os.path.getsize(cache._path("a"))
+        cache.put("c", frame())
+
+        assert os.path.exists(cache._path("a"))
+        assert not os.path.exists(cache._path("b"))
+        assert os.path.exists(cache._path("c"))
+
+    def test_expired_entry_is_a_miss_and_removed(self, tmp_path):
+        cache = DiskImageCache(str(tmp_path), ttl_seconds=60)
+        cache.put("a", frame())
+        self.set_age(cache, "a", 30)
+        assert cache.get("a") is not None
+
+        self.set_age(cache, "a", 61)
+        assert cache.get("a") is None
+        assert not os.path.exists(cache._path("a"))
+
+    def test_unreadable_entry_is_a_miss(self, tmp_path):
+        cache = DiskImageCache(str(tmp_path))
+        with open(cache._path("a"), "wb") as f:
+            f.write(b"not a png")
+
+        assert cache.get("a") is None
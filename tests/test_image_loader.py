@@ -0,0 +1,72 @@
+import pytest
+from PIL import Image, ImageOps
+
+from utils.image_loader import AdaptiveImageLoader
+
+# Inverse of the transpose each EXIF orientation asks for, used to build the stored image
+STORED_TRANSPOSE = {
+    1: None,
+    2: Image.Transpose.FLIP_LEFT_RIGHT,
+    3: Image.Transpose.ROTATE_180,
+    4: Image.Transpose.FLIP_TOP_BOTTOM,
+    5: Image.Transpose.TRANSPOSE,
+    6: Image.Transpose.ROTATE_90,
+    7: Image.Transpose.TRANSVERSE,
+    8: Image.Transpose.ROTATE_270,
+}
+
+
+def make_upright():
+    """120x80 image: red top-left corner, blue bottom-right corner, white elsewhere."""
+    img = Image.new("RGB", (120, 80), "white")
+    img.paste((255, 0, 0), (0, 0, 40, 30))
+    img.paste((0, 0, 255), (80, 50, 120, 80))
+    return img
+
+
+def save_with_orientation(path, fmt, orientation):
+    img = make_upright()
+    if STORED_TRANSPOSE[orientation] is not None:
+        img = img.transpose(STORED_TRANSPOSE[orientation])
+    exif = Image.Exif()
+    exif[0x0112] = orientation
+    img.save(path, format=fmt, exif=exif, **({"quality": 95} if fmt == "JPEG" else {}))
+
+
+def assert_close(pixel, expected, tolerance=40):
+    assert all(abs(a - b) <= tolerance for a, b in zip(pixel, expected)), (pixel, expected)
+
+
+class TestExifOrientation:
+
+    @pytest.mark.parametrize("low_resource", [False, True])
+    @pytest.mark.parametrize("fmt,ext", [("JPEG", "jpg"), ("TIFF", "tif")])
+    @pytest.mark.parametrize("orientation", range(1, 9))
+    def test_resized_image_is_upright(self, tmp_path, orientation, fmt, ext, low_resource):
+        path = tmp_path / f"image.{ext}"
+        save_with_orientation(path, fmt, orientation)
+        # Sanity check: Pillow's own transpose of the stored file gives the upright image
+        with Image.open(path) as stored:
+            assert ImageOps.exif_transpose(stored).size == (120, 80)
+
+        loader = AdaptiveImageLoader()
+        loader.is_low_resource = low_resource
+        img = loader.from_file(str(path), (60, 40))
+
+        assert img.size == (60, 40)
+        assert_close(img.getpixel((5, 5)), (255, 0, 0))
+        assert_close(img.getpixel((55, 35)), (0, 0, 255))
+        assert_close(img.getpixel((55, 5)), (255, 255, 255))
+        assert img.getexif().get(0x0112, 1) == 1
+
+    @pytest.mark.parametrize("fmt,ext", [("JPEG", "jpg"), ("TIFF", "tif")])
+    @pytest.mark.parametrize("orientation", range(1, 9))
+    def test_unresized_image_is_upright(self, tmp_path, orientation, fmt, ext):
+        path = tmp_path / f"image.{ext}"
+        save_with_orientation(path, fmt, orientation)
+
+        img = AdaptiveImageLoader().from_file(str(path), (60, 40), resize=False)
+
+        assert img.size == (120, 80)
+        assert_close(img.getpixel((5, 5)), (255, 0, 0))
+        assert_close(img.getpixel((115, 75)), (0, 0, 255))